@@ -1,4 +1,5 @@
-from typing import List, Dict, Union, Tuple
+from collections.abc import MutableMapping
+from typing import Iterator, List, Dict, Optional, Union, Tuple
 from pathlib import Path
 
 
@@ -8,13 +9,26 @@ class BusObject:
 
     offset: Dict[int, bool]
     name: str
-    data: dict
+    mapped_bus: Optional["Bus"]
 
     def __init__(self, default_read_value: int = 0x00):
         self.offsets = dict()
         self.default_read_value = default_read_value
         self.name = "BusDefault"
-        self.data = dict()
+        self.mapped_bus = None
+        self._data = dict()
+
+    @property
+    def data(self) -> Union[dict, "MappedData"]:
+        """The data held by the bus object, keyed by relative address.  While the object is mapped into a bus's memory this is a `MappedData` backed by that memory.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data: dict):
+        self._data = data
+        if self.mapped_bus is not None:
+            self.mapped_bus.map_memory()
 
     def _get_offset(self, address: int) -> Tuple[int, bool]:
         """Get the actual offset of the bus object and whether this address is "mirrored" or not.
@@ -87,12 +101,9 @@ class BusRom(BusObject):
             filename (Union[str, Path]): The path to the assembled 6502 file
             address (int, optional): Relative address to load the file. Defaults to 0x00.
         """
-        filename = Path(filename)
-        with filename.open("rb") as f:
-            data = f.read()
-        for byte in data:
-            self.data[address] = byte
-            address += 1
+        target = self.data
+        for offset, byte in enumerate(Path(filename).read_bytes(), start=address):
+            target[offset] = byte
 
 
 class BusRam(BusObject):
@@ -149,28 +160,77 @@ class BusPrinter(BusObject):
         if address >= 0x0003:
             return
         self.data[address] = value
-        match address:
-            case 0x0000:
-                self.queue.append(value)
-            case 0x0001:
-                print(f"PRINTER: {''.join([chr(i) for i in self.queue])}")
-                self.queue = dict()
-            case 0x0002:
-                self.queue = dict()
+        if address == 0x0000:
+            self.queue.append(value)
+        elif address == 0x0001:
+            print(f"PRINTER: {''.join([chr(i) for i in self.queue])}")
+            self.queue = dict()
+        elif address == 0x0002:
+            self.queue = dict()
+
+
+class MappedData(MutableMapping):
+    """The data of a bus object that is mapped into a bus's memory.  Relative addresses inside the attached pages are stored in the bus's memory, and anything past them is kept in a regular dictionary.
+
+    Args:
+        view (memoryview): The part of the bus's memory the bus object is mapped to.
+        default_read_value (int): The value an address goes back to when it is deleted.
+    """
+
+    __slots__ = ('view', 'default_read_value', 'overflow')
+
+    def __init__(self, view: memoryview, default_read_value: int):
+        self.view = view
+        self.default_read_value = default_read_value
+        self.overflow = dict()
+
+    def __getitem__(self, address: int) -> int:
+        if 0 <= address < len(self.view):
+            return self.view[address]
+        return self.overflow[address]
+
+    def __setitem__(self, address: int, value: int):
+        if 0 <= address < len(self.view):
+            self.view[address] = value & 0xFF
+        else:
+            self.overflow[address] = value
+
+    def __delitem__(self, address: int):
+        if 0 <= address < len(self.view):
+            self.view[address] = self.default_read_value
+        else:
+            del self.overflow[address]
+
+    def __iter__(self) -> Iterator[int]:
+        yield from range(len(self.view))
+        yield from self.overflow
+
+    def __len__(self) -> int:
+        return len(self.view) + len(self.overflow)
 
 
 class Bus:
-    """A basic implementation of the 6502 bus.
+    """A basic implementation of the 6502 bus.  Plain RAM and ROM objects that are attached once over a contiguous run of pages are mapped straight into `memory`, and their `data` becomes a `MappedData` backed by that part of `memory` for as long as they stay mapped.  Assigning a new `data` to a mapped object maps it again.  Pages flagged in `direct_read`/`direct_write` can be read/written by indexing `memory` without going through the bus object.
 
     Returns:
         default_read_value (int): The default return value for reads when there is no data.
     """
 
+    __slots__ = ('bus_objects', 'default_read_value', 'memory', 'direct_read', 'direct_write', 'direct_objects')
+
     bus_objects: Dict[int, BusObject]
+    memory: bytearray
+    direct_read: bytearray
+    direct_write: bytearray
+    direct_objects: List[BusObject]
 
     def __init__(self):
         self.bus_objects = {i: None for i in range(0, 0xFF)}
         self.default_read_value = 0xFF
+        self.memory = bytearray(0x10000)
+        self.direct_read = bytearray(0x100)
+        self.direct_write = bytearray(0x100)
+        self.direct_objects = list()
 
     def read(self, address: int) -> int:
         """Read a value off of the bus.
@@ -181,10 +241,27 @@ class Bus:
         Returns:
             int: The value at the address on the bus
         """
-        if not (bus_object := self.bus_objects[address >> 8]):
+        page = address >> 8
+        if self.direct_read[page]:
+            return self.memory[address]
+        if not (bus_object := self.bus_objects[page]):
             return self.default_read_value
         return bus_object.read(address)
 
+    def read_range(self, start: int, end: int) -> bytes:
+        """Read a contiguous range of values off of the bus.  When every page in the range is mapped, the range is sliced straight out of the bus memory.
+
+        Args:
+            start (int): The first address to read
+            end (int): The address to stop reading at (not included)
+
+        Returns:
+            bytes: The values in the range on the bus
+        """
+        if 0 not in self.direct_read[start >> 8:((end - 1) >> 8) + 1]:
+            return bytes(self.memory[start:end])
+        return bytes(self.read(address) for address in range(start, end))
+
     def write(self, address: int, value: int) -> None:
         """Write a value to the bus.
 
@@ -192,7 +269,11 @@ class Bus:
             address (int): The address to write
             value (int): The value to write
         """
-        if not (bus_object := self.bus_objects[address >> 8]):
+        page = address >> 8
+        if self.direct_write[page]:
+            self.memory[address] = value & 0xFF
+            return
+        if not (bus_object := self.bus_objects[page]):
             return
         bus_object.write(address, value)
 
@@ -208,12 +289,46 @@ class Bus:
         bus_object.offsets[(starting_page & 0xFF) << 8] = mirror
         for i in range(starting_page, ending_page + 1):
             self.bus_objects[i] = bus_object
+        self.map_memory()
 
     def reset_bus(self):
         """Remove all bus objects from the bus.
         """
         for i in self.bus_objects.keys():
             self.bus_objects[i] = None
+        self.map_memory()
+
+    def map_memory(self):
+        """Rebuild `memory` and the direct page flags from the attached bus objects.  Objects that were mapped into `memory` get their `data` back as a dictionary first, and every plain RAM/ROM object that is attached once over a contiguous run of pages starting at its offset is mapped again.
+        """
+        for bus_object in self.direct_objects:
+            if isinstance(bus_object._data, MappedData):
+                bus_object._data = dict(bus_object._data)
+            bus_object.mapped_bus = None
+        self.direct_objects = list()
+        self.direct_read[:] = bytes(0x100)
+        self.direct_write[:] = bytes(0x100)
+
+        for bus_object in self.get_bus_objects():
+            if type(bus_object) not in (BusRam, BusRom) or len(bus_object.offsets) != 1:
+                continue
+            if not isinstance(bus_object.data, dict):
+                continue
+            offset = next(iter(bus_object.offsets))
+            pages = sorted(page for page, obj in self.bus_objects.items() if obj is bus_object)
+            if pages != list(range(offset >> 8, (offset >> 8) + len(pages))):
+                continue
+
+            size = len(pages) << 8
+            self.memory[offset:offset + size] = bytes([bus_object.default_read_value & 0xFF]) * size
+            mapped = MappedData(memoryview(self.memory)[offset:offset + size], bus_object.default_read_value)
+            mapped.update(bus_object.data)
+            bus_object._data = mapped
+            bus_object.mapped_bus = self
+            self.direct_objects.append(bus_object)
+            for page in pages:
+                self.direct_read[page] = 1
+                self.direct_write[page] = type(bus_object) is BusRam
 
     def get_bus_objects(self) -> List[BusObject]:
         """Return all of the bus objects attached to the bus.
@@ -0,0 +1,178 @@
+from struct import Struct
+from typing import Callable, Dict, List, Tuple
+
+from mos6502.instructions import generate_addr_map, instr_6502, instr_6502_illegal
+from mos6502.periphery import NZ_FLAGS
+
+# A little-endian 16-bit value, used to fetch both address bytes of an instruction in one go
+WORD = Struct('<H')
+
+
+def _read(address: str) -> str:
+    """Build the expression that reads a byte from the bus memory, going through the bus for pages that aren't mapped.
+
+    Args:
+        address (str): The expression for the address to read.
+
+    Returns:
+        str: The read expression.
+    """
+    return f"(memory[{address}] if direct_read[({address}) >> 8] else bus.read({address}))"
+
+
+def _write(address: str, value: str) -> List[str]:
+    """Build the statements that write a byte to the bus memory, going through the bus for pages that aren't mapped.
+
+    Args:
+        address (str): The expression for the address to write.
+        value (str): The expression for the value to write.
+
+    Returns:
+        List[str]: The lines of the write.
+    """
+    return [
+        f"if direct_write[{address} >> 8]:",
+        f"    memory[{address}] = {value}",
+        "else:",
+        f"    bus.write({address}, {value})",
+    ]
+
+
+# Statements that fetch the operand bytes and resolve `address` for each addressing mode: (lines, operand bytes)
+ONE_BYTE = [f"low = {_read('pc')}", "registers.program_counter = (pc + 1) & 0xFFFF"]
+TWO_BYTES = [
+    "if direct_read[pc >> 8] and pc & 0xFF != 0xFF:",
+    "    base = read_word(memory, pc)[0]",
+    "else:",
+    f"    base = {_read('pc')} + ({_read('(pc + 1) & 0xFFFF')} << 8)",
+    "registers.program_counter = (pc + 2) & 0xFFFF",
+]
+ADDRESS_MODES = {
+    "immediate": (ONE_BYTE + ["address = None"], "low"),
+    "zero_page": (ONE_BYTE + ["address = low"], "low"),
+    "zero_page_x": (ONE_BYTE + ["address = (low + registers.X) & 0xFF"], "low"),
+    "zero_page_y": (ONE_BYTE + ["address = (low + registers.Y) & 0xFF"], "low"),
+    "absolute": (TWO_BYTES + ["address = base"], "base & 0xFF, base >> 8"),
+    "absolute_x": (TWO_BYTES + ["address = (base + registers.X) & 0xFFFF"], "base & 0xFF, base >> 8"),
+    "absolute_y": (TWO_BYTES + ["address = (base + registers.Y) & 0xFFFF"], "base & 0xFF, base >> 8"),
+    "x_indexed_zp_indirect": (ONE_BYTE + [
+        "pointer = (low + registers.X) & 0xFF",
+        "if direct_read[0] and pointer != 0xFF:",
+        "    address = read_word(memory, pointer)[0]",
+        "else:",
+        f"    address = {_read('pointer')} + ({_read('pointer + 1')} << 8)",
+    ], "low"),
+    "zp_indirect_y_indexed": (ONE_BYTE + [
+        "if direct_read[0] and low != 0xFF:",
+        "    address = (read_word(memory, low)[0] + registers.Y) & 0xFFFF",
+        "else:",
+        f"    address = ({_read('low')} + ({_read('low + 1')} << 8) + registers.Y) & 0xFFFF",
+    ], "low"),
+}
+
+# Statements that carry out each instruction on `address` and `value`: (reads the operand, lines)
+SET_NZ = "ps.value = ps.value & 0x7D | NZ_FLAGS[value]"
+COMPARE = "ps.value = ps.value & 0x7C | (value <= register) | NZ_FLAGS[(register - value) & 0xFF]"
+ADD = [
+    "p = ps.value",
+    "a = registers.A",
+    "result = a + value + (p & 0x01)",
+    "ps.value = p & 0x3C | result >> 8 | ((a ^ result) & (value ^ result) & 0x80) >> 1 | NZ_FLAGS[result & 0xFF]",
+    "registers.A = result & 0xFF",
+]
+OPERATIONS = {
+    "lda": (True, ["registers.A = value", SET_NZ]),
+    "ldx": (True, ["registers.X = value", SET_NZ]),
+    "ldy": (True, ["registers.Y = value", SET_NZ]),
+    "and": (True, ["value &= registers.A", "registers.A = value", SET_NZ]),
+    "eor": (True, ["value ^= registers.A", "registers.A = value", SET_NZ]),
+    "ora": (True, ["value |= registers.A", "registers.A = value", SET_NZ]),
+    "adc": (True, ADD),
+    "sbc": (True, ["value ^= 0xFF"] + ADD),
+    "cmp": (True, ["register = registers.A", COMPARE]),
+    "cpx": (True, ["register = registers.X", COMPARE]),
+    "cpy": (True, ["register = registers.Y", COMPARE]),
+    "bit": (True, ["ps.value = ps.value & 0x3D | value & 0xC0 | (0x00 if registers.A & value else 0x02)"]),
+    "inc": (True, ["value = value + 1 & 0xFF"] + _write("address", "value") + [SET_NZ]),
+    "dec": (True, ["value = value - 1 & 0xFF"] + _write("address", "value") + [SET_NZ]),
+    "asl": (True, [
+        "value <<= 1",
+        "ps.value = ps.value & 0x7C | value >> 8 | NZ_FLAGS[value & 0xFF]",
+    ] + _write("address", "value & 0xFF")),
+    "lsr": (True, [
+        "ps.value = ps.value & 0x7C | value & 0x01 | NZ_FLAGS[value >> 1]",
+    ] + _write("address", "value >> 1")),
+    "rol": (True, [
+        "p = ps.value",
+        "value = value << 1 | p & 0x01",
+        "ps.value = p & 0x7C | value >> 8 | NZ_FLAGS[value & 0xFF]",
+    ] + _write("address", "value & 0xFF")),
+    "ror": (True, [
+        "p = ps.value",
+        "result = value >> 1 | (p & 0x01) << 7",
+        "ps.value = p & 0x7C | value & 0x01 | NZ_FLAGS[result]",
+    ] + _write("address", "result")),
+    "sta": (False, _write("address", "registers.A")),
+    "stx": (False, _write("address", "registers.X")),
+    "sty": (False, _write("address", "registers.Y")),
+    # Illegal opcodes
+    "lax": (True, ["registers.A = value", "registers.X = value", SET_NZ]),
+    "sax": (False, _write("address", "registers.A & registers.X")),
+    "dcp": (True, ["value = value - 1 & 0xFF"] + _write("address", "value") + ["register = registers.A", COMPARE]),
+}
+
+
+def generate_handler_source(operation: str, mode: str) -> str:
+    """Generate the source of a handler factory for one instruction in one addressing mode.  The operand fetch, the addressing and the instruction itself are written out as a single straight-line function.
+
+    Args:
+        operation (str): The instruction name, e.g. `lda`.
+        mode (str): The addressing mode, e.g. `absolute_x`.
+
+    Returns:
+        str: The source of a `make_handler(cpu)` function that returns the handler.
+    """
+    fetch, operands = ADDRESS_MODES[mode]
+    reads, lines = OPERATIONS[operation]
+    if reads:
+        fetch = fetch + ["value = low" if mode == "immediate" else f"value = {_read('address')}"]
+    body = [
+        "registers = cpu.registers",
+        "bus = cpu.bus",
+        "memory = bus.memory",
+        "direct_read = bus.direct_read",
+    ]
+    if any("direct_write" in line for line in lines):
+        body.append("direct_write = bus.direct_write")
+    if any("ps." in line for line in lines):
+        body.append("ps = cpu.ps")
+    body += ["pc = registers.program_counter"] + fetch
+    body += ["if cpu._trace:", f"    cpu.current_instruction += [{operands}]"] + lines
+
+    source = ["def make_handler(cpu):", f"    def {operation}_{mode}(opcode):"]
+    source += [f"        {line}" for line in body]
+    source += [f"    return {operation}_{mode}"]
+    return "\n".join(source)
+
+
+def generate_handler_factories() -> Dict[Tuple[str, str], Callable]:
+    """Compile a handler factory for every instruction and addressing mode pair in `OPERATIONS`, including the illegal opcodes.
+
+    Returns:
+        Dict[Tuple[str, str], Callable]: A map of (instruction, addressing mode) to a factory that takes the CPU and returns the handler.
+    """
+    addr_map = generate_addr_map()
+    factories = dict()
+    for operation, opcodes in list(instr_6502.items()) + list(instr_6502_illegal.items()):
+        if operation not in OPERATIONS:
+            continue
+        for opcode in opcodes:
+            if (mode := addr_map.get(opcode)) is None or (operation, mode) in factories:
+                continue
+            namespace = {"NZ_FLAGS": NZ_FLAGS, "read_word": WORD.unpack_from}
+            exec(compile(generate_handler_source(operation, mode), f"<{operation}_{mode}>", "exec"), namespace)
+            factories[(operation, mode)] = namespace["make_handler"]
+    return factories
+
+
+HANDLER_FACTORIES = generate_handler_factories()
@@ -1,18 +1,123 @@
-from typing import Tuple, Union, Optional
+from operator import attrgetter
+from typing import Callable, Dict, List, Tuple, Union, Optional
 
 from mos6502.bus import Bus
-from mos6502.cpu_mixins import AddressingMixin, MathMixin, StackMixin
-from mos6502.instructions import generate_inst_map
-from mos6502.periphery import Registers, Status
+from mos6502.codegen import HANDLER_FACTORIES, WORD
+from mos6502.cpu_mixins import KERNEL_TABLES, AddressingMixin, MathMixin, StackMixin, add_dec, anc, arr, asr, sbx, subtract_dec
+from mos6502.instructions import generate_addr_map, generate_inst_map
+from mos6502.periphery import NZ_FLAGS, Registers, Status
+
+
+# Signed value of every possible byte, used for branch offsets
+SIGNED_BYTES = tuple(value - 0x100 if value & 0x80 else value for value in range(0x100))
+
+# Branch conditions: opcode -> (status mask, value the masked status must have to branch)
+BRANCH_CONDITIONS = {
+    0x90: (0x01, 0x00),
+    0xB0: (0x01, 0x01),
+    0xF0: (0x02, 0x02),
+    0x30: (0x80, 0x80),
+    0xD0: (0x02, 0x00),
+    0x10: (0x80, 0x00),
+    0x50: (0x40, 0x00),
+    0x70: (0x40, 0x40),
+}
+
+# Register transfers that set the negative and zero flags: (source, destination)
+TRANSFERS = {
+    "tax": ("A", "X"),
+    "tay": ("A", "Y"),
+    "tsx": ("stack_pointer", "X"),
+    "txa": ("X", "A"),
+    "tya": ("Y", "A"),
+}
 
 
 def convert_int(value: int) -> int:
     """
     Convert unsigned int into a properly signed int.
     """
-    if (value >> 7):
-        return (value ^ 0xFF) + 1
-    return value
+    return SIGNED_BYTES[value & 0xFF]
+
+
+def _step_many(cpu: "CPU", count: int) -> None:
+    """The fetch/decode/execute loop behind `CPU.step_many`.  Everything the loop touches is bound to a local before it starts.
+
+    Args:
+        cpu (CPU): The CPU to run.
+        count (int): The number of instructions to execute.
+    """
+    registers = cpu.registers
+    bus = cpu.bus
+    memory = bus.memory
+    direct_read = bus.direct_read
+    inst_table = cpu.inst_table
+    trace = cpu._trace
+    for _ in range(count):
+        pc = registers.program_counter
+        opcode = memory[pc] if direct_read[pc >> 8] else bus.read(pc)
+        registers.program_counter = (pc + 1) & 0xFFFF
+        if trace:
+            cpu.current_instruction_pc = pc
+            cpu.current_instruction = [opcode]
+        inst_table[opcode](opcode)
+
+
+def _run_until(cpu: "CPU", halt_on: Optional[int]) -> None:
+    """The fetch/decode/execute loop behind `CPU.run_program`.  The opcode fetched for the halt check is the one that gets executed next, so each instruction is only fetched once.
+
+    Args:
+        cpu (CPU): The CPU to run.
+        halt_on (int, optional): The opcode to halt on.
+    """
+    registers = cpu.registers
+    bus = cpu.bus
+    memory = bus.memory
+    direct_read = bus.direct_read
+    inst_table = cpu.inst_table
+    trace = cpu._trace
+    pc = registers.program_counter
+    opcode = memory[pc] if direct_read[pc >> 8] else bus.read(pc)
+    while True:
+        registers.program_counter = (pc + 1) & 0xFFFF
+        if trace:
+            cpu.current_instruction_pc = pc
+            cpu.current_instruction = [opcode]
+        inst_table[opcode](opcode)
+        pc = registers.program_counter
+        opcode = memory[pc] if direct_read[pc >> 8] else bus.read(pc)
+        if opcode == halt_on:
+            break
+
+
+def _run_block(cpu: "CPU", count: int, halt_on: int) -> int:
+    """The fetch/decode/execute loop behind `CPU.run_block` when a halt opcode is given.
+
+    Args:
+        cpu (CPU): The CPU to run.
+        count (int): The maximum number of instructions to execute.
+        halt_on (int): The opcode to halt on.
+
+    Returns:
+        int: The number of instructions executed.
+    """
+    registers = cpu.registers
+    bus = cpu.bus
+    memory = bus.memory
+    direct_read = bus.direct_read
+    inst_table = cpu.inst_table
+    trace = cpu._trace
+    for executed in range(count):
+        pc = registers.program_counter
+        opcode = memory[pc] if direct_read[pc >> 8] else bus.read(pc)
+        if opcode == halt_on:
+            return executed
+        registers.program_counter = (pc + 1) & 0xFFFF
+        if trace:
+            cpu.current_instruction_pc = pc
+            cpu.current_instruction = [opcode]
+        inst_table[opcode](opcode)
+    return count
 
 
 class CPU(MathMixin, AddressingMixin, StackMixin):
@@ -23,20 +128,39 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         use_illegal (bool): allow use of 'illegal' opcodes for the 6502.
     """
 
+    __slots__ = (
+        'instruction_map', 'addr_table', 'addr_only_table', 'inst_table', 'decimal_handlers', 'decimal_mode',
+        'bus', 'registers', 'ps', 'current_instruction', 'current_instruction_pc', '_trace', 'interrupt_vectors',
+    )
+
     bus: Bus
     registers: Registers
     ps: Status
     current_instruction: list
     current_instruction_pc: int
+    _trace: bool
     interrupt_vectors: dict
+    addr_table: List[Optional[Callable[[], Tuple[int, int]]]]
+    addr_only_table: List[Optional[Callable[[], int]]]
+    inst_table: List[Callable[[int], None]]
+    decimal_handlers: Tuple[Dict[int, Callable[[int], None]], Dict[int, Callable[[int], None]]]
+    decimal_mode: int
 
     def __init__(self, origin: int = 0, use_illegal: bool = False):
         self.instruction_map = generate_inst_map(include_illegal=use_illegal)
+        addr_map = generate_addr_map()
+        self.addr_table = self.generate_addr_table(addr_map)
+        self.addr_only_table = self.generate_addr_table(addr_map, address_only=True)
+        self.decimal_handlers = (dict(), dict())
+        self.decimal_mode = 0
+        self.inst_table = self.generate_inst_table()
         self.bus = Bus()
         self.registers = Registers()
         self.ps = Status()
         self.registers.program_counter = origin
         self.current_instruction = list()
+        self.current_instruction_pc = origin
+        self._trace = False
         self.interrupt_vectors = {
             "BRK": 0xFFFE,
             "RST": 0xFFFC,
@@ -45,306 +169,257 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
             "COP": 0xFFF4,
         }
 
-    def run_program(self, halt_on: Optional[int] = None) -> None:
-        """Execute the program and stop execution if the opcode 'halt_on' is specified.
+    def generate_inst_table(self) -> List[Callable[[int], None]]:
+        """Build the top-level dispatch table indexed by opcode.  Instructions that depend on the decimal flag get a binary and a decimal handler per addressing mode, and the handlers for the current mode are swapped into the table by `_sync_decimal_mode`.
 
-        Args:
-            halt_on (int, optional): The opcode to halt on. Defaults to None.
+        Returns:
+            List[Callable[[int], None]]: A 256 entry list of instruction handlers indexed by opcode.
         """
-        while True:
-            self.process_instruction()
-            if self.bus.read(self.registers.program_counter) == halt_on:
-                break
-
-    def read_value(self) -> int:
-        """Read the value located at the current program counter's location and increment the program counter.
+        decimal_kernels = {
+            "adc": add_dec,
+            "sbc": subtract_dec,
+        }
+        addr_map = generate_addr_map()
+        table = [self._i_unknown] * 0x100
+        for opcode, inst_name in self.instruction_map.items():
+            factory = HANDLER_FACTORIES.get((inst_name, addr_map.get(opcode)))
+            if inst_name in decimal_kernels:
+                self.decimal_handlers[0][opcode] = factory(self)
+                self.decimal_handlers[1][opcode] = self._specialize_kernel(decimal_kernels[inst_name], self.addr_table[opcode])
+                table[opcode] = self.decimal_handlers[self.decimal_mode][opcode]
+            elif inst_name in TRANSFERS:
+                table[opcode] = self._specialize_transfer(*TRANSFERS[inst_name])
+            elif inst_name == "branch":
+                table[opcode] = self._specialize_branch(*BRANCH_CONDITIONS[opcode])
+            elif factory:
+                table[opcode] = factory(self)
+            else:
+                table[opcode] = getattr(self, f'_i_{inst_name}')
+        return table
+
+    def _specialize_kernel(self, kernel: Callable[[int, int, int], Tuple[int, bool, bool, bool, bool]], address_mode: Callable[[], Tuple[int, int]]) -> Callable[[int], None]:
+        """Bind an accumulator arithmetic kernel to a single addressing mode.  The kernel's results are looked up in its table from `KERNEL_TABLES`.
+
+        Args:
+            kernel (Callable): The kernel that takes the accumulator, operand and carry, and returns the result and the C, V, N and Z flags.
+            address_mode (Callable[[], Tuple[int, int]]): The addressing method that retrieves the operand.
 
         Returns:
-            int: the value that the program counter points to
+            Callable[[int], None]: The specialized handler for the opcode.
         """
-        v = self.bus.read(self.registers.program_counter)
-        self.registers.program_counter += 1
-        self.current_instruction.append(v)
-        return v
+        apply_kernel = self._apply_kernel
+        table = None
 
-    def process_instruction(self) -> int:
-        """Process the instruction at the current program counter location
+        def handler(opcode: int):
+            nonlocal table
+            if table is None:
+                # Bound on first use so the table is still only built once decimal mode is actually used
+                table = KERNEL_TABLES[kernel]
+            apply_kernel(table, address_mode()[1])
+        return handler
 
-        Returns:
-            int: The opcode of the current instruction
+    def _sync_decimal_mode(self) -> None:
+        """Swap the handlers for the current state of the decimal flag into the dispatch table if the flag has changed.
         """
-        self.current_instruction_pc = self.registers.program_counter
-        opcode = self.read_value()
-        self.current_instruction = [opcode]
-        inst_name = self.instruction_map[opcode]
-        getattr(self, f'_i_{inst_name}')(opcode)
-        return opcode
+        decimal = self.ps.value >> 3 & 1
+        if decimal != self.decimal_mode:
+            self.decimal_mode = decimal
+            for opcode, handler in self.decimal_handlers[decimal].items():
+                self.inst_table[opcode] = handler
 
-    # 6502 Opcodes/Instructions
-    def _i_lda(self, opcode: int):
-        """Load the A register/accumulator with a value from memory.
+    def _specialize_transfer(self, source: str, destination: str) -> Callable[[int], None]:
+        """Build a handler that copies one register into another and sets the negative and zero flags from the copied value.
 
         Args:
-            opcode (int): The LDA opcode to process.
+            source (str): The name of the register to copy from.
+            destination (str): The name of the register to copy to.
+
+        Returns:
+            Callable[[int], None]: The transfer handler for the opcode.
         """
+        get_source = attrgetter(source)
+
+        def handler(opcode: int):
+            registers = self.registers
+            value = get_source(registers)
+            setattr(registers, destination, value)
+            ps = self.ps
+            ps.value = ps.value & 0x7D | NZ_FLAGS[value]
+        return handler
 
-        match opcode:
-            case 0xA1:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0xA5:
-                _, value = self._a_zero_page()
-            case 0xA9:
-                _, value = self._a_immediate()
-            case 0xAD:
-                _, value = self._a_absolute()
-            case 0xB1:
-                _, value = self._a_zp_indirect_y_indexed()
-            case 0xB5:
-                _, value = self._a_zero_page_indexed('X')
-            case 0xB9:
-                _, value = self._a_indexed_absolute('Y')
-            case 0xBD:
-                _, value = self._a_indexed_absolute('X')
-
-        self.registers.A = value
-        self.ps.flags.zero = not bool(value)
-        self.ps.flags.negative = bool(value >> 7)
-
-    def _i_ldx(self, opcode: int):
-        """Load the X register with a value from memory.
+    def _specialize_branch(self, mask: int, expected: int) -> Callable[[int], None]:
+        """Build a handler for a single branch instruction with its condition baked in.
 
         Args:
-            opcode (int): The LDX opcode to process.
-        """
+            mask (int): The status bits the branch tests.
+            expected (int): The value the masked status must have for the branch to be taken.
+
+        Returns:
+            Callable[[int], None]: The branch handler for the opcode.
+        """
+        def handler(opcode: int):
+            registers = self.registers
+            bus = self.bus
+            pc = registers.program_counter
+            offset = bus.memory[pc] if bus.direct_read[pc >> 8] else bus.read(pc)
+            if self._trace:
+                self.current_instruction.append(offset)
+            if self.ps.value & mask == expected:
+                registers.program_counter = (pc + 1 + SIGNED_BYTES[offset]) & 0xFFFF
+            else:
+                registers.program_counter = (pc + 1) & 0xFFFF
+        return handler
 
-        match opcode:
-            case 0xA2:
-                _, value = self._a_immediate()
-            case 0xAE:
-                _, value = self._a_absolute()
-            case 0xBE:
-                _, value = self._a_indexed_absolute('Y')
-            case 0xA6:
-                _, value = self._a_zero_page()
-            case 0xB6:
-                _, value = self._a_zero_page_indexed('Y')
-
-        self.registers.X = value
-        self.ps.flags.zero = not bool(value)
-        self.ps.flags.negative = bool(value >> 7)
-
-    def _i_ldy(self, opcode: int):
-        """Load the Y register with a value from memory.
+    def run_program(self, halt_on: Optional[int] = None) -> None:
+        """Execute the program and stop execution if the opcode 'halt_on' is specified.  Without a halt opcode the program runs in blocks of instructions with no per-instruction check until something raises.
 
         Args:
-            opcode (int): The LDY opcode to process.
+            halt_on (int, optional): The opcode to halt on. Defaults to None.
         """
+        self._sync_decimal_mode()
+        if halt_on is None:
+            while True:
+                _step_many(self, 0x10000)
+        _run_until(self, halt_on)
 
-        match opcode:
-            case 0xA0:
-                _, value = self._a_immediate()
-            case 0xAC:
-                _, value = self._a_absolute()
-            case 0xBC:
-                _, value = self._a_indexed_absolute('X')
-            case 0xA4:
-                _, value = self._a_zero_page()
-            case 0xB4:
-                _, value = self._a_zero_page_indexed('X')
-
-        self.registers.Y = value
-        self.ps.flags.zero = not bool(value)
-        self.ps.flags.negative = bool(value >> 7)
-
-    def _i_adc(self, opcode: int):
-        """Add a given value with the accumulator including the carry bit.
+    def step_many(self, count: int) -> None:
+        """Execute a number of instructions in a single loop with the fetch and dispatch done inline.
 
         Args:
-            opcode (int): The ADC opcode to process.
+            count (int): The number of instructions to execute.
         """
+        self._sync_decimal_mode()
+        _step_many(self, count)
 
-        match opcode:
-            case 0x61:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x65:
-                _, value = self._a_zero_page()
-            case 0x69:
-                _, value = self._a_immediate()
-            case 0x6D:
-                _, value = self._a_absolute()
-            case 0x71:
-                _, value = self._a_zp_indirect_y_indexed()
-            case 0x75:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x79:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x7D:
-                _, value = self._a_indexed_absolute('X')
-
-        self.add_to_accumulator(value)
-
-    def _i_and(self, opcode: int):
-        """Perform bitwise "and" operation between a value and the accumulator.
+    def run_block(self, count: int, halt_on: Optional[int] = None) -> int:
+        """Execute up to a number of instructions in a single loop, stopping early at the opcode 'halt_on' if it is specified.  The halting opcode is not executed.
 
         Args:
-            opcode (int): The AND opcode to process.
+            count (int): The maximum number of instructions to execute.
+            halt_on (int, optional): The opcode to halt on. Defaults to None.
+
+        Returns:
+            int: The number of instructions executed.
         """
+        if halt_on is None:
+            self.step_many(count)
+            return count
+        self._sync_decimal_mode()
+        return _run_block(self, count, halt_on)
 
-        match opcode:
-            case 0x21:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x25:
-                _, value = self._a_zero_page()
-            case 0x29:
-                _, value = self._a_immediate()
-            case 0x2D:
-                _, value = self._a_absolute()
-            case 0x31:
-                _, value = self._a_zp_indirect_y_indexed()
-            case 0x35:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x39:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x3D:
-                _, value = self._a_indexed_absolute('X')
-
-        self.registers.A &= value
-        self.ps.flags.negative = bool(self.registers.A >> 7)
-        self.ps.flags.zero = not bool(self.registers.A)
+    def read_value(self) -> int:
+        """Read the value located at the current program counter's location and increment the program counter.
 
-    def _i_asl(self, opcode: int):
-        """Arithmetically shift left a given value.
+        Returns:
+            int: the value that the program counter points to
+        """
+        registers = self.registers
+        pc = registers.program_counter
+        bus = self.bus
+        v = bus.memory[pc] if bus.direct_read[pc >> 8] else bus.read(pc)
+        registers.program_counter = (pc + 1) & 0xFFFF
+        if self._trace:
+            self.current_instruction.append(v)
+        return v
+
+    def read_word(self) -> int:
+        """Read the little-endian address located at the current program counter's location and increment the program counter past it.
+
+        Returns:
+            int: the address that the program counter points to
+        """
+        registers = self.registers
+        pc = registers.program_counter
+        bus = self.bus
+        memory, direct_read = bus.memory, bus.direct_read
+        if direct_read[pc >> 8] and pc & 0xFF != 0xFF:
+            v = WORD.unpack_from(memory, pc)[0]
+        else:
+            low = memory[pc] if direct_read[pc >> 8] else bus.read(pc)
+            pc_next = (pc + 1) & 0xFFFF
+            v = low + ((memory[pc_next] if direct_read[pc_next >> 8] else bus.read(pc_next)) << 8)
+        registers.program_counter = (pc + 2) & 0xFFFF
+        if self._trace:
+            self.current_instruction += [v & 0xFF, v >> 8]
+        return v
+
+    def write_value(self, address: int, value: int) -> None:
+        """Write a value to memory, storing straight into the bus memory when the page is mapped.
 
         Args:
-            opcode (int): The ASL opcode to process.
+            address (int): The address to write to.
+            value (int): The value to write.
         """
+        bus = self.bus
+        if bus.direct_write[address >> 8]:
+            bus.memory[address] = value
+        else:
+            bus.write(address, value)
 
-        def arithmetic_shift_left(value):
-            self.ps.flags.carry = bool(value >> 7)
-            value = (value << 1) & 0xFF
-            self.ps.flags.zero = not bool(value)
-            self.ps.flags.negative = bool(value >> 7)
-            return value
-
-        match opcode:
-            case 0x06:
-                address, value = self._a_zero_page()
-            case 0x0A:
-                self.registers.A = arithmetic_shift_left(self.registers.A)
-            case 0x0E:
-                address, value = self._a_absolute()
-            case 0x16:
-                address, value = self._a_zero_page_indexed('X')
-            case 0x1E:
-                address, value = self._a_indexed_absolute('X')
-
-        if opcode not in [0x0A]:
-            self.bus.write(address, arithmetic_shift_left(value))
+    def process_instruction(self) -> int:
+        """Process the instruction at the current program counter location
 
-    def _i_brk(self, opcode: int):
-        """Break processor operations.
+        Returns:
+            int: The opcode of the current instruction
+        """
+        self._sync_decimal_mode()
+        if self._trace:
+            self.current_instruction_pc = self.registers.program_counter
+            self.current_instruction = list()
+        opcode = self.read_value()
+        self.inst_table[opcode](opcode)
+        return opcode
 
-        Args:
-            opcode (int): The BRK opcode to process.
+    def enable_trace(self) -> None:
+        """Record the address and bytes of each instruction in `current_instruction_pc` and `current_instruction` as it executes.  Tracing is off by default since it costs a list update for every byte fetched.
         """
-        self.ps.flags.pbreak = True
-        self._s_push_address(self.registers.program_counter + 1)
-        self._s_push_byte(self.ps.status.value)
-        self.ps.flags.interrupt_mask = True
-        address = self.interrupt_vectors["BRK"]
-        self.registers.program_counter = self.bus.read(
-            address) + (self.bus.read(address + 1) << 8)
+        self._trace = True
+
+    def disable_trace(self) -> None:
+        """Stop recording the address and bytes of each instruction.
+        """
+        self._trace = False
 
-    def _i_cmp(self, opcode: int):
-        """Compare a given value to the accumulator.
+    def _i_unknown(self, opcode: int):
+        """Handle an opcode that is not in the instruction map.
 
         Args:
-            opcode (int): The CMP opcode to process.
+            opcode (int): The unknown opcode.
         """
+        raise KeyError(opcode)
 
-        match opcode:
-            case 0xC9:
-                _, value = self._a_immediate()
-            case 0xCD:
-                _, value = self._a_absolute()
-            case 0xDD:
-                _, value = self._a_indexed_absolute('X')
-            case 0xD9:
-                _, value = self._a_indexed_absolute('Y')
-            case 0xC5:
-                _, value = self._a_zero_page()
-            case 0xD5:
-                _, value = self._a_zero_page_indexed('X')
-            case 0xC1:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0xD1:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        result = (self.registers.A - value) & 0xFF
-        self.ps.flags.zero = (self.registers.A == value)
-        self.ps.flags.negative = bool(result >> 7)
-        self.ps.flags.carry = (value <= self.registers.A)
-
-    def _i_branch(self, opcode: int):
-        """Perform a branching instruction based on the opcode provided.
+    # 6502 Opcodes/Instructions
+    def _i_asl(self, opcode: int):
+        """Arithmetically shift left the accumulator.
 
         Args:
-            opcode (int): The branching instruction opcode to process.
+            opcode (int): The ASL opcode to process.
         """
 
-        value = self.read_value()
-        value = convert_int(value)
-
-        match opcode:
-            case 0x90:
-                if not self.ps.flags.carry:
-                    self.registers.program_counter += value
-            case 0xB0:
-                if self.ps.flags.carry:
-                    self.registers.program_counter += value
-            case 0xF0:
-                if self.ps.flags.zero:
-                    self.registers.program_counter += value
-            case 0x30:
-                if self.ps.flags.negative:
-                    self.registers.program_counter += value
-            case 0xD0:
-                if not self.ps.flags.zero:
-                    self.registers.program_counter += value
-            case 0x10:
-                if not self.ps.flags.negative:
-                    self.registers.program_counter += value
-            case 0x50:
-                if not self.ps.flags.overflow:
-                    self.registers.program_counter += value
-            case 0x70:
-                if self.ps.flags.overflow:
-                    self.registers.program_counter += value
-
-    def _i_sta(self, opcode: int):
-        """Store value in the accumulator.
+        ps = self.ps
+        registers = self.registers
+        value = registers.A << 1
+        ps.value = ps.value & 0x7C | value >> 8 | NZ_FLAGS[value & 0xFF]
+        registers.A = value & 0xFF
+
+    def _i_brk(self, opcode: int):
+        """Break processor operations.  Bits 4 and 5 are set to `1` in the pushed processor status, the same as PHP.
 
         Args:
-            opcode (int): The STA opcode to process.
+            opcode (int): The BRK opcode to process.
         """
-
-        match opcode:
-            case 0x8D:
-                address, _ = self._a_absolute()
-            case 0x9D:
-                address, _ = self._a_indexed_absolute('X')
-            case 0x99:
-                address, _ = self._a_indexed_absolute('Y')
-            case 0x85:
-                address, _ = self._a_zero_page()
-            case 0x95:
-                address, _ = self._a_zero_page_indexed('X')
-            case 0x81:
-                address, _ = self._a_x_indexed_zp_indirect()
-            case 0x91:
-                address, _ = self._a_zp_indirect_y_indexed()
-
-        self.bus.write(address, self.registers.A)
+        ps = self.ps
+        registers = self.registers
+        p = ps.value
+        self._s_push_address(registers.program_counter + 1)
+        self._s_push_byte(p | 0x30)
+        ps.value = p | 0x04
+        address = self.interrupt_vectors["BRK"]
+        bus = self.bus
+        memory, direct_read = bus.memory, bus.direct_read
+        low = memory[address] if direct_read[address >> 8] else bus.read(address)
+        high = memory[address + 1] if direct_read[(address + 1) >> 8] else bus.read(address + 1)
+        registers.program_counter = low + (high << 8)
 
     def _i_inx(self, opcode: int):
         """Increment the X register.
@@ -352,9 +427,11 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The INX opcode to process.
         """
-        self.registers.X += 1
-        self.ps.flags.negative = bool(self.registers.X >> 7)
-        self.ps.flags.zero = not bool(self.registers.X)
+        ps = self.ps
+        registers = self.registers
+        value = registers.X + 1 & 0xFF
+        registers.X = value
+        ps.value = ps.value & 0x7D | NZ_FLAGS[value]
 
     def _i_iny(self, opcode: int):
         """Increment the Y register.
@@ -362,31 +439,11 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The INY opcode to process.
         """
-        self.registers.Y += 1
-        self.ps.flags.negative = bool(self.registers.Y >> 7)
-        self.ps.flags.zero = not bool(self.registers.Y)
-
-    def _i_inc(self, opcode: int):
-        """Increment a value in memory.
-
-        Args:
-            opcode (int): The INC opcode to process.
-        """
-
-        match opcode:
-            case 0xEE:
-                address, value = self._a_absolute()
-            case 0xFE:
-                address, value = self._a_indexed_absolute('X')
-            case 0xE6:
-                address, value = self._a_zero_page()
-            case 0xF6:
-                address, value = self._a_zero_page_indexed('X')
-
-        value = value + 1 & 0xFF
-        self.bus.write(address, value)
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.zero = not bool(value)
+        ps = self.ps
+        registers = self.registers
+        value = registers.Y + 1 & 0xFF
+        registers.Y = value
+        ps.value = ps.value & 0x7D | NZ_FLAGS[value]
 
     def _i_dex(self, opcode: int):
         """Decrement the X register.
@@ -394,9 +451,11 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The DEX opcode to process.
         """
-        self.registers.X -= 1
-        self.ps.flags.negative = bool(self.registers.X >> 7)
-        self.ps.flags.zero = not bool(self.registers.X)
+        ps = self.ps
+        registers = self.registers
+        value = registers.X - 1 & 0xFF
+        registers.X = value
+        ps.value = ps.value & 0x7D | NZ_FLAGS[value]
 
     def _i_dey(self, opcode: int):
         """Decrement the Y register.
@@ -404,31 +463,11 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The DEY opcode to process.
         """
-        self.registers.Y -= 1
-        self.ps.flags.negative = bool(self.registers.Y >> 7)
-        self.ps.flags.zero = not bool(self.registers.Y)
-
-    def _i_dec(self, opcode: int):
-        """Decrement a value in memory.
-
-        Args:
-            opcode (int): The DEC opcode to process.
-        """
-
-        match opcode:
-            case 0xCE:
-                address, value = self._a_absolute()
-            case 0xDE:
-                address, value = self._a_indexed_absolute('X')
-            case 0xC6:
-                address, value = self._a_zero_page()
-            case 0xD6:
-                address, value = self._a_zero_page_indexed('X')
-
-        value = value - 1 & 0xFF
-        self.bus.write(address, value)
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.zero = not bool(value)
+        ps = self.ps
+        registers = self.registers
+        value = registers.Y - 1 & 0xFF
+        registers.Y = value
+        ps.value = ps.value & 0x7D | NZ_FLAGS[value]
 
     def _i_jmp(self, opcode: int):
         """Jump to another part of the program.
@@ -437,13 +476,7 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
             opcode (int): The JMP opcode to process.
         """
 
-        match opcode:
-            case 0x4C:
-                address, _ = self._a_absolute()
-            case 0x6C:
-                address, _ = self._a_indirect()
-
-        self.registers.program_counter = address
+        self.registers.program_counter = self.addr_only_table[opcode]()
 
     def _i_sed(self, opcode: int):
         """Set the decimal flag on the processor.
@@ -451,7 +484,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The SED opcode to process.
         """
-        self.ps.flags.decimal = True
+        self.ps.value |= 0x08
+        self._sync_decimal_mode()
 
     def _i_cld(self, opcode: int):
         """Clear the decimal flag on the processor.
@@ -459,7 +493,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The CLD opcode to process.
         """
-        self.ps.flags.decimal = False
+        self.ps.value &= 0xF7
+        self._sync_decimal_mode()
 
     def _i_clc(self, opcode: int):
         """Clear the carry flag on the processor.
@@ -467,7 +502,7 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The CLC opcode to process.
         """
-        self.ps.flags.carry = False
+        self.ps.value &= 0xFE
 
     def _i_cli(self, opcode: int):
         """Clear the interrupt mask flag on the processor.
@@ -475,7 +510,7 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The CLI opcode to process.
         """
-        self.ps.flags.interrupt_mask = False
+        self.ps.value &= 0xFB
 
     def _i_clv(self, opcode: int):
         """Clear the overflow flag on the processor.
@@ -483,123 +518,20 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The CLV opcode to process.
         """
-        self.ps.flags.overflow = False
-
-    def _i_bit(self, opcode: int):
-        """Test bits in memory.
-
-        Args:
-            opcode (int): The BIT opcode to process.
-        """
-
-        match opcode:
-            case 0x2C:
-                _, value = self._a_absolute()
-            case 0x24:
-                _, value = self._a_zero_page()
-
-        v = self.registers.A & value
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.overflow = bool((value >> 6) & 1)
-        self.ps.flags.zero = not bool(v)
-
-    def _i_cpx(self, opcode: int):
-        """Compare the X register with memory.
-
-        Args:
-            opcode (int): The CPX opcode to process.
-        """
-
-        match opcode:
-            case 0xE0:
-                _, value = self._a_immediate()
-            case 0xEC:
-                _, value = self._a_absolute()
-            case 0xE4:
-                _, value = self._a_zero_page()
-
-        result = (self.registers.X - value) & 0xFF
-        self.ps.flags.negative = (result >> 7)
-        self.ps.flags.carry = self.registers.X >= value
-        self.ps.flags.zero = not bool(result)
-
-    def _i_cpy(self, opcode: int):
-        """Compare the Y register with memory.
-
-        Args:
-            opcode (int): The CPY opcode to process.
-        """
-
-        match opcode:
-            case 0xC0:
-                _, value = self._a_immediate()
-            case 0xCC:
-                _, value = self._a_absolute()
-            case 0xC4:
-                _, value = self._a_zero_page()
-
-        result = (self.registers.Y - value) & 0xFF
-        self.ps.flags.negative = (result >> 7)
-        self.ps.flags.carry = self.registers.Y >= value
-        self.ps.flags.zero = not bool(result)
-
-    def _i_eor(self, opcode: int):
-        """Exlusive OR the accumulator with memory.
-
-        Args:
-            opcode (int): The EOR opcode to process.
-        """
-
-        match opcode:
-            case 0x49:
-                _, value = self._a_immediate()
-            case 0x4D:
-                _, value = self._a_absolute()
-            case 0x5D:
-                _, value = self._a_indexed_absolute('X')
-            case 0x59:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x45:
-                _, value = self._a_zero_page()
-            case 0x55:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x41:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x51:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        self.registers.A ^= value
-        self.ps.flags.negative = bool(self.registers.A >> 7)
-        self.ps.flags.zero = not bool(self.registers.A)
+        self.ps.value &= 0xBF
 
     def _i_lsr(self, opcode: int):
-        """Logical shift right the accumulator or a value in memory.
+        """Logical shift right the accumulator.
 
         Args:
             opcode (int): The LSR opcode to process.
         """
 
-        match opcode:
-            case 0x4A:
-                value = self.registers.A
-            case 0x4E:
-                address, value = self._a_absolute()
-            case 0x5E:
-                address, value = self._a_indexed_absolute('X')
-            case 0x46:
-                address, value = self._a_zero_page()
-            case 0x56:
-                address, value = self._a_zero_page_indexed('X')
-
-        self.ps.flags.carry = value & 1
-        value >>= 1
-        self.ps.flags.negative = False
-        self.ps.flags.zero = not bool(value)
-
-        if opcode == 0x4A:
-            self.registers.A = value
-        else:
-            self.bus.write(address, value)
+        ps = self.ps
+        registers = self.registers
+        value = registers.A
+        ps.value = ps.value & 0x7C | value & 0x01 | NZ_FLAGS[value >> 1]
+        registers.A = value >> 1
 
     def _i_nop(self, opcode: int):
         """Don't do anything (no operation)
@@ -607,46 +539,9 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The NOP opcode to not process.
         """
-        match opcode:
-            case 0x80 | 0x82 | 0x89 | 0xC2 | 0xE2:
-                self._a_immediate()
-            case 0x04 | 0x44 | 0x64:
-                self._a_zero_page()
-            case 0x14 | 0x34 | 0x54 | 0x74 | 0xD4 | 0xF4:
-                self._a_zero_page_indexed('X')
-            case 0x0C:
-                self._a_absolute()
-            case 0x1C | 0x3C | 0x5C | 0x7C | 0xDC | 0xFC:
-                self._a_indexed_absolute('X')
-
-    def _i_ora(self, opcode: int):
-        """Bitwise OR a value and the contents of the accumulator.
-
-        Args:
-            opcode (int): The ORA opcode to process.
-        """
-
-        match opcode:
-            case 0x09:
-                _, value = self._a_immediate()
-            case 0x05:
-                _, value = self._a_zero_page()
-            case 0x15:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x0D:
-                _, value = self._a_absolute()
-            case 0x1D:
-                _, value = self._a_indexed_absolute('X')
-            case 0x19:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x01:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x11:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        self.registers.A |= value
-        self.ps.flags.zero = not bool(self.registers.A)
-        self.ps.flags.negative = bool(self.registers.A >> 7)
+        address_mode = self.addr_table[opcode]
+        if address_mode is not None:
+            address_mode()
 
     def _i_jsr(self, opcode: int):
         """Jump to subroutine.
@@ -654,9 +549,20 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The JSR opcode to process.
         """
-        address, _ = self._a_absolute()
-        self._s_push_address(self.registers.program_counter)
-        self.registers.program_counter = address
+        registers = self.registers
+        bus = self.bus
+        address = self.read_word()
+        sp = registers.stack_pointer
+        pc = (registers.program_counter - 1) & 0xFFFF
+        if bus.direct_write[1]:
+            memory = bus.memory
+            memory[0x100 + sp] = pc >> 8
+            memory[0x100 + ((sp - 1) & 0xFF)] = pc & 0xFF
+        else:
+            bus.write(0x100 + sp, pc >> 8)
+            bus.write(0x100 + ((sp - 1) & 0xFF), pc & 0xFF)
+        registers.stack_pointer = (sp - 2) & 0xFF
+        registers.program_counter = address
 
     def _i_pha(self, opcode: int):
         """Push the accumulator contents onto the stack.
@@ -664,7 +570,14 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The PHA opcode to process.
         """
-        self._s_push_byte(self.registers.A)
+        registers = self.registers
+        bus = self.bus
+        sp = registers.stack_pointer
+        if bus.direct_write[1]:
+            bus.memory[0x100 + sp] = registers.A
+        else:
+            bus.write(0x100 + sp, registers.A)
+        registers.stack_pointer = (sp - 1) & 0xFF
 
     def _i_php(self, opcode: int):
         """Push the processor status onto the stack.  Bits 4 and 5 are set to `1` when pushed.
@@ -672,7 +585,14 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The PHP opcode to process.
         """
-        self._s_push_byte(self.ps.status.value | 0x30)
+        registers = self.registers
+        bus = self.bus
+        sp = registers.stack_pointer
+        if bus.direct_write[1]:
+            bus.memory[0x100 + sp] = self.ps.value | 0x30
+        else:
+            bus.write(0x100 + sp, self.ps.value | 0x30)
+        registers.stack_pointer = (sp - 1) & 0xFF
 
     def _i_pla(self, opcode: int):
         """Pull the accumulator contents off of the stack.
@@ -680,83 +600,66 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The PLA opcode to process.
         """
-        self.registers.A = self._s_pop_byte()
-        self.ps.flags.zero = not bool(self.registers.A)
-        self.ps.flags.negative = (self.registers.A >> 7)
+        ps = self.ps
+        registers = self.registers
+        bus = self.bus
+        sp = (registers.stack_pointer + 1) & 0xFF
+        value = bus.memory[0x100 + sp] if bus.direct_read[1] else bus.read(0x100 + sp)
+        registers.stack_pointer = sp
+        registers.A = value
+        ps.value = ps.value & 0x7D | NZ_FLAGS[value]
 
     def _i_plp(self, opcode: int):
-        """Pull the processor status off of the stack.  Bits 4 and 5 are ignored when pulled from the stack.
+        """Pull the processor status off of the stack.  Bits 4 and 5 are ignored when pulled from the stack, so the break bit stays clear and the unused bit stays set.
 
         Args:
             opcode (int): The PLP opcode to process.
         """
-        self.ps.status.value = self._s_pop_byte() & ~(0x30)
+        registers = self.registers
+        bus = self.bus
+        sp = (registers.stack_pointer + 1) & 0xFF
+        value = bus.memory[0x100 + sp] if bus.direct_read[1] else bus.read(0x100 + sp)
+        registers.stack_pointer = sp
+        self.ps.value = value & 0xCF | 0x20
+        self._sync_decimal_mode()
 
     def _i_rol(self, opcode: int):
-        """Rotate the contents of the accumulator or memory value to the left.
+        """Rotate the contents of the accumulator to the left.
 
         Args:
             opcode (int): The ROL opcode to process.
         """
 
-        match opcode:
-            case 0x2A:
-                value = self.registers.A
-            case 0x2E:
-                address, value = self._a_absolute()
-            case 0x3E:
-                address, value = self._a_indexed_absolute('X')
-            case 0x26:
-                address, value = self._a_zero_page()
-            case 0x36:
-                address, value = self._a_zero_page_indexed('X')
-
-        result = ((value << 1) & 0xFF) + self.ps.flags.carry
-        self.ps.flags.carry = value >> 7
-        self.ps.flags.negative = result >> 7
-        self.ps.flags.zero = not bool(result)
-
-        if opcode == 0x2A:
-            self.registers.A = result
-        else:
-            self.bus.write(address, result)
+        ps = self.ps
+        registers = self.registers
+        p = ps.value
+        value = registers.A << 1 | p & 0x01
+        ps.value = p & 0x7C | value >> 8 | NZ_FLAGS[value & 0xFF]
+        registers.A = value & 0xFF
 
     def _i_ror(self, opcode: int):
-        """Rotate the contents of the accumulator or memory value to the right.
+        """Rotate the contents of the accumulator to the right.
 
         Args:
             opcode (int): The ROR opcode to process.
         """
 
-        match opcode:
-            case 0x6A:
-                value = self.registers.A
-            case 0x6E:
-                address, value = self._a_absolute()
-            case 0x7E:
-                address, value = self._a_indexed_absolute('X')
-            case 0x66:
-                address, value = self._a_zero_page()
-            case 0x76:
-                address, value = self._a_zero_page_indexed('X')
-
-        result = ((value >> 1)) + (self.ps.flags.carry << 7)
-        self.ps.flags.carry = value & 1
-        self.ps.flags.negative = result >> 7
-        self.ps.flags.zero = not bool(result)
-
-        if opcode == 0x6A:
-            self.registers.A = result
-        else:
-            self.bus.write(address, result)
+        ps = self.ps
+        registers = self.registers
+        p = ps.value
+        value = registers.A
+        result = value >> 1 | (p & 0x01) << 7
+        ps.value = p & 0x7C | value & 0x01 | NZ_FLAGS[result]
+        registers.A = result
 
     def _i_rti(self, opcode: int):
-        """Return from interrupt.
+        """Return from interrupt.  Bits 4 and 5 of the pulled processor status are ignored the same way as PLP.
 
         Args:
             opcode (int): The RTI opcode to process.
         """
-        self.ps.status.value = self._s_pop_byte()
+        self.ps.value = self._s_pop_byte() & 0xCF | 0x20
+        self._sync_decimal_mode()
         self.registers.program_counter = self._s_pop_address()
 
     def _i_rts(self, opcode: int):
@@ -765,7 +668,18 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The RTS opcode to process.
         """
-        self.registers.program_counter = self._s_pop_address() + 1
+        registers = self.registers
+        bus = self.bus
+        sp = registers.stack_pointer
+        low_address = 0x100 + ((sp + 1) & 0xFF)
+        high_address = 0x100 + ((sp + 2) & 0xFF)
+        if bus.direct_read[1]:
+            memory = bus.memory
+            address = memory[low_address] + (memory[high_address] << 8)
+        else:
+            address = bus.read(low_address) + (bus.read(high_address) << 8)
+        registers.stack_pointer = (sp + 2) & 0xFF
+        registers.program_counter = (address + 1) & 0xFFFF
 
     def _i_sec(self, opcode: int):
         """Set the carry flag on the processor.
@@ -773,33 +687,7 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The SEC opcode to process.
         """
-        self.ps.flags.carry = True
-
-    def _i_sbc(self, opcode: int):
-        """Subtract value from the accumulator with borrow.
-
-        Args:
-            opcode (int): The SBC opcode to process.
-        """
-        match opcode:
-            case 0xE9:
-                _, value = self._a_immediate()
-            case 0xED:
-                _, value = self._a_absolute()
-            case 0xFD:
-                _, value = self._a_indexed_absolute('X')
-            case 0xF9:
-                _, value = self._a_indexed_absolute('Y')
-            case 0xE5:
-                _, value = self._a_zero_page()
-            case 0xF5:
-                _, value = self._a_zero_page_indexed('X')
-            case 0xE1:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0xF1:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        self.subtract_from_accumulator(value)
+        self.ps.value |= 0x01
 
     def _i_sei(self, opcode: int):
         """Set the interrupt mask flag on the CPU.
@@ -807,81 +695,7 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The SEI opcode to process.
         """
-        self.ps.flags.interrupt_mask = True
-
-    def _i_stx(self, opcode: int):
-        """Store value into the X register.
-
-        Args:
-            opcode (int): The STX opcode to process.
-        """
-
-        match opcode:
-            case 0x8E:
-                address, _ = self._a_absolute()
-            case 0x86:
-                address, _ = self._a_zero_page()
-            case 0x96:
-                address, _ = self._a_zero_page_indexed('Y')
-
-        self.bus.write(address, self.registers.X)
-
-    def _i_sty(self, opcode: int):
-        """Store value into the Y register.
-
-        Args:
-            opcode (int): The STY opcode to process.
-        """
-
-        match opcode:
-            case 0x8C:
-                address, _ = self._a_absolute()
-            case 0x84:
-                address, _ = self._a_zero_page()
-            case 0x94:
-                address, _ = self._a_zero_page_indexed('X')
-
-        self.bus.write(address, self.registers.Y)
-
-    def _i_tax(self, opcode: int):
-        """Transfer the contents of the accumulator into the X register.
-
-        Args:
-            opcode (int): The TAX opcode to process.
-        """
-        self.registers.X = self.registers.A
-        self.ps.flags.negative = bool(self.registers.X >> 7)
-        self.ps.flags.zero = not bool(self.registers.X)
-
-    def _i_tay(self, opcode: int):
-        """Transfer the contents of the accumulator into the Y register.
-
-        Args:
-            opcode (int): The TAY opcode to process.
-        """
-        self.registers.Y = self.registers.A
-        self.ps.flags.negative = bool(self.registers.Y >> 7)
-        self.ps.flags.zero = not bool(self.registers.Y)
-
-    def _i_tsx(self, opcode: int):
-        """Transfer the stack pointer value into the X register.
-
-        Args:
-            opcode (int): The TSX opcode to process.
-        """
-        self.registers.X = self.registers.stack_pointer
-        self.ps.flags.negative = bool(self.registers.X >> 7)
-        self.ps.flags.zero = not bool(self.registers.X)
-
-    def _i_txa(self, opcode: int):
-        """Transfer the contents of the X register into the accumulator.
-
-        Args:
-            opcode (int): The TXA opcode to process.
-        """
-        self.registers.A = self.registers.X
-        self.ps.flags.negative = bool(self.registers.A >> 7)
-        self.ps.flags.zero = not bool(self.registers.A)
+        self.ps.value |= 0x04
 
     def _i_txs(self, opcode: int):
         """Transfer the contents of the X register into the stack pointer value.
@@ -889,17 +703,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The TXS opcode to process.
         """
-        self.registers.stack_pointer = self.registers.X
-
-    def _i_tya(self, opcode: int):
-        """Transfer the contents of the accumulator into the Y register.
-
-        Args:
-            opcode (int): The TYA opcode to process.
-        """
-        self.registers.A = self.registers.Y
-        self.ps.flags.negative = bool(self.registers.A >> 7)
-        self.ps.flags.zero = not bool(self.registers.A)
+        registers = self.registers
+        registers.stack_pointer = registers.X
 
     # Illegal opcodes that don't already have definitions
     def _i_slo(self, opcode: int) -> None:
@@ -908,27 +713,15 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcodes (int): The SLO opcode to process
         """
-        match opcode:
-            case 0x07:
-                _, value = self._a_zero_page()
-            case 0x17:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x0F:
-                _, value = self._a_absolute()
-            case 0x1F:
-                _, value = self._a_indexed_absolute('X')
-            case 0x1B:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x03:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x13:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        self.ps.flags.carry = (value >> 7)
-        value = (value << 1) | self.registers.A
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.zero = not bool(value)
-        self.registers.A = value
+        address, value = self.addr_table[opcode]()
+
+        shifted = value << 1 & 0xFF
+        self.write_value(address, shifted)
+        ps = self.ps
+        registers = self.registers
+        result = shifted | registers.A
+        ps.value = ps.value & 0x7C | value >> 7 | NZ_FLAGS[result]
+        registers.A = result
 
     def _i_rla(self, opcode: int) -> None:
         """Rotate left one bit in memory, then AND accumulator with memory. (ROL + AND)
@@ -936,29 +729,16 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The RLA opcode to process.
         """
-        match opcode:
-            case 0x27:
-                _, value = self._a_zero_page()
-            case 0x37:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x2F:
-                _, value = self._a_absolute()
-            case 0x3F:
-                _, value = self._a_indexed_absolute('X')
-            case 0x3B:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x23:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x33:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        carry = self.ps.flags.carry
-        self.ps.flags.carry = (value >> 7)
-        value = ((value << 1) + carry) & self.registers.A
-        value &= 0xFF
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.zero = not bool(value)
-        self.registers.A = value
+        address, value = self.addr_table[opcode]()
+
+        ps = self.ps
+        registers = self.registers
+        p = ps.value
+        rotated = (value << 1 | p & 0x01) & 0xFF
+        self.write_value(address, rotated)
+        result = rotated & registers.A
+        ps.value = p & 0x7C | value >> 7 | NZ_FLAGS[result]
+        registers.A = result
 
     def _i_sre(self, opcode: int) -> None:
         """Shift right one bit in memory, then XOR accumulator with memory. (ASR + EOR)
@@ -966,27 +746,14 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The SRE opcode to process.
         """
-        match opcode:
-            case 0x47:
-                _, value = self._a_zero_page()
-            case 0x57:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x4F:
-                _, value = self._a_absolute()
-            case 0x5F:
-                _, value = self._a_indexed_absolute('X')
-            case 0x5B:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x43:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x53:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        self.ps.flags.carry = (value & 1)
-        value = (value >> 1) ^ self.registers.A
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.zero = not bool(value)
-        self.registers.A = value
+        address, value = self.addr_table[opcode]()
+
+        self.write_value(address, value >> 1)
+        ps = self.ps
+        registers = self.registers
+        result = value >> 1 ^ registers.A
+        ps.value = ps.value & 0x7C | value & 0x01 | NZ_FLAGS[result]
+        registers.A = result
 
     def _i_rra(self, opcode: int) -> None:
         """Rotate memory one bit to the right, then add memory to the accumulator. (ROR + ADC)
@@ -994,100 +761,14 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The RRA opcode to process.
         """
-        match opcode:
-            case 0x67:
-                _, value = self._a_zero_page()
-            case 0x77:
-                _, value = self._a_zero_page_indexed('X')
-            case 0x6F:
-                _, value = self._a_absolute()
-            case 0x7F:
-                _, value = self._a_indexed_absolute('X')
-            case 0x7B:
-                _, value = self._a_indexed_absolute('Y')
-            case 0x63:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0x73:
-                _, value = self._a_zp_indirect_y_indexed()
-
-        carry = self.ps.flags.carry
-        self.ps.flags.carry = (value & 1)
-        value = (value >> 1) & (carry << 7)
-        self.subtract_from_accumulator(value)
+        address, value = self.addr_table[opcode]()
 
-    def _i_sax(self, opcode: int) -> None:
-        """AND the contents of the accumulator and X register, then store the result in memory. (STA + STX)
-
-        Args:
-            opcode (int): The SAX opcode to process.
-        """
-        match opcode:
-            case 0x87:
-                address, _ = self._a_zero_page()
-            case 0x8F:
-                address, _ = self._a_absolute()
-            case 0x83:
-                address, _ = self._a_x_indexed_zp_indirect()
-            case 0x97:
-                address, _ = self._a_zero_page_indexed('Y')
-
-        value = self.registers.A & self.registers.X
-        self.bus.write(address, value)
-
-    def _i_lax(self, opcode: int) -> None:
-        """Load the accumulator and X register with a value from memory. (LDA + LDX)
-
-        Args:
-            opcode (int): The LAX opcode to process.
-        """
-        match opcode:
-            case 0xA7:
-                _, value = self._a_zero_page()
-            case 0xAF:
-                _, value = self._a_absolute()
-            case 0xBF:
-                _, value = self._a_indexed_absolute('Y')
-            case 0xA3:
-                _, value = self._a_x_indexed_zp_indirect()
-            case 0xB3:
-                _, value = self._a_zp_indirect_y_indexed()
-            case 0xB7:
-                _, value = self._a_zero_page_indexed('Y')
-
-        self.registers.A = value
-        self.registers.X = value
-        self.ps.flags.negative = bool(value >> 7)
-        self.ps.flags.zero = not bool(value)
-
-    def _i_dcp(self, opcode: int) -> None:
-        """Decrement the value of a location in memory, then compare with the accumulator. (DEC + CMP)
-
-        Args:
-            opcode (int): The DCP opcode to process.
-        """
-        match opcode:
-            case 0xC7:
-                address, value = self._a_zero_page()
-            case 0xD7:
-                address, value = self._a_zero_page_indexed('X')
-            case 0xCF:
-                address, value = self._a_absolute()
-            case 0xDF:
-                address, value = self._a_indexed_absolute('X')
-            case 0xDB:
-                address, value = self._a_indexed_absolute('Y')
-            case 0xC3:
-                address, value = self._a_x_indexed_zp_indirect()
-            case 0xD3:
-                address, value = self._a_zp_indirect_y_indexed()
-
-        value = (value - 1) & 0xFF
-        self.bus.write(address, value)
-        result = self.registers.A - value
-        result = result if result >= 0 else result + 0x100
-        self.ps.flags.zero = (self.registers.A == value)
-        self.ps.flags.negative = bool(result >> 7)
-        self.ps.flags.carry = (value <= self.registers.A)
+        ps = self.ps
+        p = ps.value
+        result = value >> 1 | (p & 0x01) << 7
+        self.write_value(address, result)
+        ps.value = p & 0xFE | value & 0x01
+        self.add_to_accumulator(result)
 
     def _i_isb(self, opcode: int) -> None:
         """Increase the value in memory by one, then subtract the result from the accumulator. (INC + SBC)
@@ -1095,24 +776,10 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The ISB opcode to process.
         """
-        match opcode:
-            case 0xE7:
-                address, value = self._a_zero_page()
-            case 0xF7:
-                address, value = self._a_zero_page_indexed('X')
-            case 0xEF:
-                address, value = self._a_absolute()
-            case 0xFF:
-                address, value = self._a_indexed_absolute('X')
-            case 0xFB:
-                address, value = self._a_indexed_absolute('Y')
-            case 0xE3:
-                address, value = self._a_x_indexed_zp_indirect()
-            case 0xF3:
-                address, value = self._a_zp_indirect_y_indexed()
+        address, value = self.addr_table[opcode]()
 
         value = (value + 1) & 0xFF
-        self.bus.write(address, value)
+        self.write_value(address, value)
         self.subtract_from_accumulator(value)
 
     def _i_anc(self, opcode: int) -> None:
@@ -1122,8 +789,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
             opcode (int): The ANC opcode to process.
         """
         _, value = self._a_immediate()
-        self.registers.A &= value
-        self.ps.flags.carry = bool(self.registers.A >> 7)
+        registers, ps = self.registers, self.ps
+        registers.A, ps.value = anc(registers.A, value, ps.value)
 
     def _i_asr(self, opcode: int) -> None:
         """AND the contents of the accumulator with an immediate value, then right shift the results. (AND + LSR)
@@ -1132,11 +799,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
             opcode (int): The ASR opcode to process.
         """
         _, value = self._a_immediate()
-        self.registers.A &= value
-        self.ps.flags.carry = (self.registers.A & 1)
-        self.registers.A >>= 1
-        self.ps.flags.negative = 0
-        self.ps.flags.zero = bool(self.registers.A)
+        registers, ps = self.registers, self.ps
+        registers.A, ps.value = asr(registers.A, value, ps.value)
 
     def _i_arr(self, opcode: int) -> None:
         """AND the accumulator with an immediate value and then rotate the content right. (AND + ROR)
@@ -1145,26 +809,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
             opcode (int): The ARR opcode to process.
         """
         _, value = self._a_immediate()
-        self.ps.flags.accumulator &= value
-
-        # Get overflow setting post-AND
-        a = self.registers.A
-        status = self.ps.status.value
-        self.add_to_accumulator(value)
-        overflow = self.ps.flags.overflow
-        self.ps.status.value = status
-        self.registers.A = a
-        self.ps.flags.overflow = overflow
-
-        carry = self.ps.flags.carry
-        bit_7 = (value >> 7)
-        bit_6 = (value >> 6 & 1)
-
-        self.registers.A >>= 1
-        self.ps.flags.carry = bit_7
-        self.ps.flags.overflow = bit_7 ^ bit_6
-        self.registers.A |= (carry << 7)
-        self.ps.flags.zero = bool(self.registers.A)
+        registers, ps = self.registers, self.ps
+        registers.A, ps.value = arr(registers.A, value, ps.value)
 
     def _i_sbx(self, opcode: int) -> None:
         """AND the values of the accumulator and X register, subtract the immediate value, then store into the X register. (CMP + DEX)
@@ -1173,12 +819,8 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
             opcode (int): The SBX opcode to process.
         """
         _, value = self._a_immediate()
-        temp = self.register.A & self.register.X
-        self.ps.flags.carry = (value <= temp)
-        temp = ((temp - value) & 0xFF)
-        self.registers.X = temp
-        self.ps.flags.negative = bool(temp >> 7)
-        self.ps.flags.zero = not bool(temp)
+        registers, ps = self.registers, self.ps
+        registers.X, ps.value = sbx(registers.A & registers.X, value, ps.value)
 
     def _i_las(self, opcode: int) -> None:
         """AND memory with the stack pointer, then transfer the result to the accumulator, X, and stack pointer registers. (STA/TXS + LDA/TSX)
@@ -1186,10 +828,11 @@ class CPU(MathMixin, AddressingMixin, StackMixin):
         Args:
             opcode (int): The LAS opcode to process.
         """
-        _, value = self._a_immediate()
-        result = self.registers.stack_pointer & value
-        self.registers.A = result
-        self.registers.X = result
-        self.registers.stack_pointer = result
-        self.ps.flags.zero = not bool(result)
-        self.ps.flags.negative = bool(result >> 7)
+        _, value = self.addr_table[opcode]()
+        ps = self.ps
+        registers = self.registers
+        result = registers.stack_pointer & value
+        registers.A = result
+        registers.X = result
+        registers.stack_pointer = result
+        ps.value = ps.value & 0x7D | NZ_FLAGS[result]
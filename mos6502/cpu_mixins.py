@@ -1,10 +1,218 @@
-from typing import Tuple
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mos6502.codegen import WORD
+from mos6502.periphery import NZ_FLAGS
+
+
+# The low byte of every possible byte after incrementing it without a carry
+LOW_BYTE_INC = bytes((value + 1) & 0xFF for value in range(0x100))
+
+
+# The ADC/SBC kernels work on plain integers only, so they can be called without touching the CPU state.
+def add_bin(a: int, v: int, c: int) -> Tuple[int, bool, bool, bool, bool]:
+    """Add a value and carry to an accumulator value in binary mode.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The value to add to the accumulator.
+        c (int): The carry flag.
+
+    Returns:
+        tuple (int, bool, bool, bool, bool): The result followed by the carry, overflow, negative and zero flags.
+    """
+    result = a + v + c
+    carry = result > 0xFF
+    result &= 0xFF
+    overflow = ((a ^ result) & (v ^ result) & 0x80) != 0
+    return (result, carry, overflow, result >= 0x80, result == 0)
+
+
+def add_dec(a: int, v: int, c: int) -> Tuple[int, bool, bool, bool, bool]:
+    """Add a value and carry to an accumulator value in decimal mode.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The value to add to the accumulator.
+        c (int): The carry flag.
+
+    Returns:
+        tuple (int, bool, bool, bool, bool): The result followed by the carry, overflow, negative and zero flags.
+    """
+    temp = (a & 0x0F) + (v & 0x0F) + c
+    if temp >= 0x0A:
+        temp = ((temp + 0x06) & 0x0F) + 0x10
+    temp += (a & 0xF0) + (v & 0xF0)
+    temp2 = temp
+    if temp >= 0xA0:
+        temp += 0x60
+
+    overflow = ((~(a ^ v) & (a ^ temp2)) & 0x80) != 0
+    carry = temp > 99
+    zero = ((a + v + carry) & 0xFF) == 0
+    return (temp & 0xFF, carry, overflow, (temp & 0xFF) >= 0x80, zero)
+
+
+def subtract_bin(a: int, v: int, c: int) -> Tuple[int, bool, bool, bool, bool]:
+    """Subtract a value and borrow from an accumulator value in binary mode.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The value to subtract from the accumulator.
+        c (int): The carry flag (0 means borrow).
+
+    Returns:
+        tuple (int, bool, bool, bool, bool): The result followed by the carry, overflow, negative and zero flags.
+    """
+    result = a + (v ^ 0xFF) + c
+    carry = result > 0xFF
+    result &= 0xFF
+    overflow = ((a ^ result) & ((v ^ 0xFF) ^ result) & 0x80) != 0
+    return (result, carry, overflow, result >= 0x80, result == 0)
+
+
+def subtract_dec(a: int, v: int, c: int) -> Tuple[int, bool, bool, bool, bool]:
+    """Subtract a value and borrow from an accumulator value in decimal mode.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The value to subtract from the accumulator.
+        c (int): The carry flag (0 means borrow).
+
+    Returns:
+        tuple (int, bool, bool, bool, bool): The result followed by the carry, overflow, negative and zero flags.
+    """
+    # After days of frustration, this is slightly altered code from mnaberez's py65
+    # project...and I greatly appreciate that it works as does my sanity...
+    halfcarry = 1
+    adjust0 = 0
+    adjust1 = 0
+
+    nibble0 = (a & 0xf) + (~v & 0xf) + c
+    if nibble0 <= 0xf:
+        halfcarry = 0
+        adjust0 = 10
+    nibble1 = ((a >> 4) & 0xf) + ((~v >> 4) & 0xf) + halfcarry
+    if nibble1 <= 0xf:
+        adjust1 = 10 << 4
+
+    # the ALU outputs are not decimally adjusted
+    aluresult = a + (~v & 0xFF) + c
+    decimalcarry = aluresult > 0xFF
+    aluresult &= 0xFF
+
+    # but the final result will be adjusted
+    nibble0 = (aluresult + adjust0) & 0xf
+    nibble1 = ((aluresult + adjust1) >> 4) & 0xf
+
+    overflow = (((a ^ v) & (a ^ aluresult)) & 0x80) != 0
+    return ((nibble1 << 4) + nibble0, decimalcarry, overflow, aluresult >= 0x80, aluresult == 0)
+
+
+# The immediate-mode illegal opcode kernels take the register, operand and processor status, and return the new register and status values.
+def anc(a: int, v: int, p: int) -> Tuple[int, int]:
+    """AND an immediate value with the accumulator and copy bit 7 of the result into the carry.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The immediate value.
+        p (int): The processor status.
+
+    Returns:
+        tuple (int, int): The new accumulator value and processor status.
+    """
+    result = a & v
+    return (result, p & 0x7C | result >> 7 | NZ_FLAGS[result])
+
+
+def asr(a: int, v: int, p: int) -> Tuple[int, int]:
+    """AND an immediate value with the accumulator, then shift the result right one bit.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The immediate value.
+        p (int): The processor status.
+
+    Returns:
+        tuple (int, int): The new accumulator value and processor status.
+    """
+    value = a & v
+    result = value >> 1
+    return (result, p & 0x7C | value & 0x01 | NZ_FLAGS[result])
+
+
+def arr(a: int, v: int, p: int) -> Tuple[int, int]:
+    """AND an immediate value with the accumulator, then rotate the result right one bit.  The carry comes from bit 6 of the result and overflow from bits 6 and 5 XOR'd together.
+
+    Args:
+        a (int): The accumulator value.
+        v (int): The immediate value.
+        p (int): The processor status.
+
+    Returns:
+        tuple (int, int): The new accumulator value and processor status.
+    """
+    result = (a & v) >> 1 | (p & 0x01) << 7
+    carry = result >> 6 & 0x01
+    overflow = carry ^ (result >> 5 & 0x01)
+    return (result, p & 0x3C | carry | overflow << 6 | NZ_FLAGS[result])
+
+
+def sbx(a: int, v: int, p: int) -> Tuple[int, int]:
+    """Subtract an immediate value from the accumulator AND'd with the X register, setting the flags like a compare.
+
+    Args:
+        a (int): The accumulator value AND'd with the X register.
+        v (int): The immediate value.
+        p (int): The processor status.
+
+    Returns:
+        tuple (int, int): The new X register value and processor status.
+    """
+    result = (a - v) & 0xFF
+    return (result, p & 0x7C | (v <= a) | NZ_FLAGS[result])
+
+
+def kernel_table(kernel: Callable[[int, int, int], Tuple[int, bool, bool, bool, bool]]) -> array:
+    """Run a kernel for every accumulator, operand and carry value.  Use `KERNEL_TABLES` to get a table rather than building it again.
+
+    Each entry is indexed by `a | v << 8 | c << 16` and holds the result in the low byte and the carry, zero, overflow and negative status bits in the high byte.
+
+    Args:
+        kernel (Callable): The kernel to tabulate, e.g. `add_bin`.
+
+    Returns:
+        array: The 0x20000 entry table of packed results.
+    """
+    table = array('H', bytes(0x40000))
+    index = 0
+    for c in (0, 1):
+        for v in range(0x100):
+            for a in range(0x100):
+                result, carry, overflow, negative, zero = kernel(a, v, c)
+                table[index] = result | (carry | zero << 1 | overflow << 6 | negative << 7) << 8
+                index += 1
+    return table
+
+
+class KernelTables(dict):
+    """The result tables of the ALU kernels keyed by kernel.  A table is built the first time it's looked up, so a program only pays for the kernels it uses.
+    """
+
+    def __missing__(self, kernel: Callable[[int, int, int], Tuple[int, bool, bool, bool, bool]]) -> array:
+        table = self[kernel] = kernel_table(kernel)
+        return table
+
+
+KERNEL_TABLES = KernelTables()
 
 
 class AddressingMixin:
     """A CPU mixin that implements all of the addressing methods for 6502 instructions along with helper methods.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def inc_no_carry(value: int) -> int:
         """Increments the low-byte of an address without carrying to the high byte
@@ -16,8 +224,69 @@ class AddressingMixin:
             value (int): the value incremented while ignoring any carry operations to the high byte
         """
         value &= 0xFFFF
-        address = (value + 1 & 0xFF) + (value & 0xFF00)
-        return address
+        return (value & 0xFF00) | LOW_BYTE_INC[value & 0xFF]
+
+    def read_pointer(self, pointer: int, pointer_next: int) -> int:
+        """Read a little-endian pointer from memory, reading both bytes at once when they sit next to each other in mapped memory.
+
+        Args:
+            pointer (int): The address of the low byte.
+            pointer_next (int): The address of the high byte.
+
+        Returns:
+            int: The pointer stored at the location.
+        """
+        bus = self.bus
+        memory, direct_read = bus.memory, bus.direct_read
+        if pointer_next == pointer + 1 and direct_read[pointer >> 8] and direct_read[pointer_next >> 8]:
+            return WORD.unpack_from(memory, pointer)[0]
+        low = memory[pointer] if direct_read[pointer >> 8] else bus.read(pointer)
+        high = memory[pointer_next] if direct_read[pointer_next >> 8] else bus.read(pointer_next)
+        return low + (high << 8)
+
+    def generate_addr_table(self, addr_map: Dict[int, str], address_only: bool = False) -> List[Optional[Callable]]:
+        """Build a table indexed by opcode that holds the bound addressing method for that opcode.  This lets the instructions resolve their operand with a single lookup instead of matching on the opcode.
+
+        Args:
+            addr_map (Dict[int, str]): A map of opcodes to their addressing mode.
+            address_only (bool, optional): Use the `_a_*_addr` methods that only resolve the address and skip reading the data.  Immediate mode has no address and is left out.  Defaults to False.
+
+        Returns:
+            List[Optional[Callable]]: A 256 entry list of addressing methods indexed by opcode.
+        """
+        if address_only:
+            modes = {
+                "zero_page": self._a_zero_page_addr,
+                "zero_page_x": self._a_zero_page_x_addr,
+                "zero_page_y": self._a_zero_page_y_addr,
+                "absolute": self._a_absolute_addr,
+                "absolute_x": self._a_absolute_x_addr,
+                "absolute_y": self._a_absolute_y_addr,
+                "indirect": self._a_indirect_addr,
+                "x_indexed_zp_indirect": self._a_x_indexed_zp_indirect_addr,
+                "zp_indirect_y_indexed": self._a_zp_indirect_y_indexed_addr,
+            }
+            table = [None] * 0x100
+            for opcode, mode in addr_map.items():
+                table[opcode] = modes.get(mode)
+            return table
+
+        modes = {
+            "immediate": self._a_immediate,
+            "zero_page": self._a_zero_page,
+            "zero_page_x": self._a_zero_page_x,
+            "zero_page_y": self._a_zero_page_y,
+            "absolute": self._a_absolute,
+            "absolute_x": self._a_absolute_x,
+            "absolute_y": self._a_absolute_y,
+            "indirect": self._a_indirect,
+            "x_indexed_zp_indirect": self._a_x_indexed_zp_indirect,
+            "zp_indirect_y_indexed": self._a_zp_indirect_y_indexed,
+        }
+        table = [None] * 0x100
+        for opcode, mode in addr_map.items():
+            table[opcode] = modes[mode]
+        return table
 
     # Addressing functions
     def _a_x_indexed_zp_indirect(self) -> Tuple[int, int]:
@@ -28,11 +297,11 @@ class AddressingMixin:
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
-        offset = self.read_value()
-        address = (offset + self.registers.X) & 0xFF
-        address = self.bus.read(address) + (self.bus.read(address + 1) << 8)
-        address &= 0xFFFF
-        return (address, self.bus.read(address))
+        bus = self.bus
+        memory, direct_read = bus.memory, bus.direct_read
+        pointer = (self.read_value() + self.registers.X) & 0xFF
+        address = self.read_pointer(pointer, pointer + 1)
+        return (address, memory[address] if direct_read[address >> 8] else bus.read(address))
 
     def _a_zp_indirect_y_indexed(self) -> Tuple[int, int]:
         """Retrieve the address by taking the second byte of the instruction and reading that location in the zero page.  After grabbing the data from zero page, add the Y register to that address and get the data at the new address.
@@ -42,11 +311,11 @@ class AddressingMixin:
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
+        bus = self.bus
+        memory, direct_read = bus.memory, bus.direct_read
         offset = self.read_value()
-        address = self.bus.read(
-            offset) + (self.bus.read(offset + 1) << 8) + self.registers.Y
-        address &= 0xFFFF
-        return (address, self.bus.read(address))
+        address = (self.read_pointer(offset, offset + 1) + self.registers.Y) & 0xFFFF
+        return (address, memory[address] if direct_read[address >> 8] else bus.read(address))
 
     def _a_zero_page(self) -> Tuple[int, int]:
         """Retrieve the address by taking the second byte of the instruction and reading the data in the zero page referenced by the second byte.
@@ -56,24 +325,34 @@ class AddressingMixin:
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
+        bus = self.bus
         address = self.read_value()
         address &= 0xFF
-        return (address, self.bus.read(address))
+        return (address, bus.memory[address] if bus.direct_read[0] else bus.read(address))
 
-    def _a_zero_page_indexed(self, register: str) -> Tuple[int, int]:
-        """Retrieve the address by taking the second byte of the instruction, then adding the contents of the specified register, then looking up the value at that address on the zero page.  There is no carry when adding the register to the second byte of the instruction.
+    def _a_zero_page_x(self) -> Tuple[int, int]:
+        """Retrieve the address by taking the second byte of the instruction, then adding the contents of the X register, then looking up the value at that address on the zero page.  There is no carry when adding the register to the second byte of the instruction.
 
-        Example: `XXX $nn,X` or `XXX $nn,Y`
+        Example: `XXX $nn,X`
 
-        Args:
-            register (str): The register to use.
+        Returns:
+            tuple (int, int): Address referenced and the data at the location.
+        """
+        bus = self.bus
+        address = (self.read_value() + self.registers.X) & 0xFF
+        return (address, bus.memory[address] if bus.direct_read[0] else bus.read(address))
+
+    def _a_zero_page_y(self) -> Tuple[int, int]:
+        """Retrieve the address by taking the second byte of the instruction, then adding the contents of the Y register, then looking up the value at that address on the zero page.  There is no carry when adding the register to the second byte of the instruction.
+
+        Example: `XXX $nn,Y`
 
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
-        address = self.read_value() + getattr(self.registers, register)
-        address &= 0xFF
-        return (address, self.bus.read(address))
+        bus = self.bus
+        address = (self.read_value() + self.registers.Y) & 0xFF
+        return (address, bus.memory[address] if bus.direct_read[0] else bus.read(address))
 
     def _a_absolute(self) -> Tuple[int, int]:
         """Retrieve the data by directly referencing the address given in the second (low) and third (high) bytes of the instruction.
@@ -83,9 +362,9 @@ class AddressingMixin:
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
-        address = self.read_value() + (self.read_value() << 8)
-        address &= 0xFFFF
-        return (address, self.bus.read(address))
+        bus = self.bus
+        address = self.read_word()
+        return (address, bus.memory[address] if bus.direct_read[address >> 8] else bus.read(address))
 
     def _a_indirect(self) -> Tuple[int, int]:
         """Retrieve the data by getting the data specified at the second (low) and third (high) bytes of the instruction, then take that data and use it as an address to retrieve the relevant data.
@@ -95,30 +374,33 @@ class AddressingMixin:
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
-        addr_low, addr_high = self.read_value(), self.read_value()
-        address = addr_low + (addr_high << 8)
-        address_next = self.inc_no_carry(address)
+        address = self.read_word()
+        pointer = self.read_pointer(address, self.inc_no_carry(address))
+        return (pointer, pointer & 0xFF)
 
-        next_address = self.bus.read(
-            address) + (self.bus.read(address_next) << 8)
-        next_address &= 0xFFFF
-        return (next_address, self.bus.read(address))
+    def _a_absolute_x(self) -> Tuple[int, int]:
+        """Retrieve the data at the address specified in the second (low) and third (high) bytes of the instruction plus the contents of the X register.
 
-    def _a_indexed_absolute(self, register: str) -> Tuple[int, int]:
-        """Retrieve the data at the address specified in the second (low) and third (high) bytes of the instruction plus the contents of the specified register.
+        Example: `XXX $nnnn,X`
+
+        Returns:
+            tuple (int, int): Address referenced and the data at the location.
+        """
+        bus = self.bus
+        address = (self.read_word() + self.registers.X) & 0xFFFF
+        return (address, bus.memory[address] if bus.direct_read[address >> 8] else bus.read(address))
 
-        Example: `XXX $nnnn,X` or `XXX $nnnn,Y`
+    def _a_absolute_y(self) -> Tuple[int, int]:
+        """Retrieve the data at the address specified in the second (low) and third (high) bytes of the instruction plus the contents of the Y register.
 
-        Args:
-            register (str): The register to use.
+        Example: `XXX $nnnn,Y`
 
         Returns:
             tuple (int, int): Address referenced and the data at the location.
         """
-        r = getattr(self.registers, register)
-        address = self.read_value() + (self.read_value() << 8) + r
-        address &= 0xFFFF
-        return (address, self.bus.read(address))
+        bus = self.bus
+        address = (self.read_word() + self.registers.Y) & 0xFFFF
+        return (address, bus.memory[address] if bus.direct_read[address >> 8] else bus.read(address))
 
     def _a_immediate(self) -> Tuple[None, int]:
         """Retrieve the data at the second byte of the instruction, and return the data.  This method does not return an address as the second byte of the instruction holds the relevant data.
@@ -130,11 +412,89 @@ class AddressingMixin:
         """
         return (None, self.read_value())
 
+    # Address-only variants of the addressing functions
+    def _a_x_indexed_zp_indirect_addr(self) -> int:
+        """Resolve the address for `XXX ($nn,X)` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        pointer = (self.read_value() + self.registers.X) & 0xFF
+        return self.read_pointer(pointer, pointer + 1)
+
+    def _a_zp_indirect_y_indexed_addr(self) -> int:
+        """Resolve the address for `XXX ($nn),Y` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        offset = self.read_value()
+        return (self.read_pointer(offset, offset + 1) + self.registers.Y) & 0xFFFF
+
+    def _a_zero_page_addr(self) -> int:
+        """Resolve the address for `XXX $nn` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        return self.read_value() & 0xFF
+
+    def _a_zero_page_x_addr(self) -> int:
+        """Resolve the address for `XXX $nn,X` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        return (self.read_value() + self.registers.X) & 0xFF
+
+    def _a_zero_page_y_addr(self) -> int:
+        """Resolve the address for `XXX $nn,Y` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        return (self.read_value() + self.registers.Y) & 0xFF
+
+    def _a_absolute_addr(self) -> int:
+        """Resolve the address for `XXX $nnnn` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        return self.read_word()
+
+    def _a_indirect_addr(self) -> int:
+        """Resolve the address for `XXX ($nnnn)` without reading the data at the pointer.
+
+        Returns:
+            int: Address referenced.
+        """
+        address = self.read_word()
+        return self.read_pointer(address, self.inc_no_carry(address))
+
+    def _a_absolute_x_addr(self) -> int:
+        """Resolve the address for `XXX $nnnn,X` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        return (self.read_word() + self.registers.X) & 0xFFFF
+
+    def _a_absolute_y_addr(self) -> int:
+        """Resolve the address for `XXX $nnnn,Y` without reading the data at it.
+
+        Returns:
+            int: Address referenced.
+        """
+        return (self.read_word() + self.registers.Y) & 0xFFFF
+
 
 class MathMixin:
     """A CPU mixin that implements the ADC and SBC math functions to include binary and decimal modes.
     """
 
+    __slots__ = ()
+
     # Main "math" functions
     def add_to_accumulator(self, value: int) -> None:
         """Add the value to the accumulator and set all appropriate flags/registers.
@@ -142,10 +502,7 @@ class MathMixin:
         Args:
             value (int): The value to add to the accumulator.
         """
-        if self.ps.flags.decimal:
-            self.__add_to_accumulator_dec(value)
-        else:
-            self.__add_to_accumulator_bin(value)
+        self._apply_kernel(KERNEL_TABLES[add_dec if self.ps.value & 0x08 else add_bin], value)
 
     def subtract_from_accumulator(self, value: int) -> None:
         """Subtract the value from the accumulator and set all the appropriate flags/registers.
@@ -153,113 +510,29 @@ class MathMixin:
         Args:
             value (int): The value to subtract from the accumulator.
         """
-        if self.ps.flags.decimal:
-            self.__subtract_from_accumulator_dec(value)
-        else:
-            self.__subtract_from_accumulator_bin(value)
-
+        self._apply_kernel(KERNEL_TABLES[subtract_dec if self.ps.value & 0x08 else subtract_bin], value)
 
-    def __add_to_accumulator_bin(self, value: int) -> None:
-        """Add the value to the accumulator in binary mode and set all of the appropriate flags/register values.
+    def _apply_kernel(self, table: array, value: int) -> None:
+        """Look up the accumulator, value and carry in a kernel table, then store the result and the C, Z, V and N flags.
 
         Args:
-            value (int): The value to add to the accumulator.
-        """
-        result = value + self.registers.A + self.ps.flags.carry
-        self.ps.flags.carry = bool(result > 0xFF)
-        result &= 0xFF
-        self.ps.flags.overflow = bool(
-            (self.registers.A ^ result) & (value ^ result) & 0x80)
-        self.ps.flags.negative = bool(result >> 7)
-        self.ps.flags.zero = result == 0
-        self.registers.A = result
-
-    def __add_to_accumulator_dec(self, value: int) -> None:
-        """Add the value to the accumulator in decimal mode and set all of the appropriate flags/register values.
-
-        Args:
-            value (int): The value to add to the accumulator.
+            table (array): The kernel table from `KERNEL_TABLES`.
+            value (int): The operand of the instruction.
         """
-        a = self.registers.A
-        v = value
-        temp = (a & 0x0F) + (v & 0x0F) + self.ps.flags.carry
-        if temp >= 0x0A:
-            temp = ((temp + 0x06) & 0x0F) + 0x10
-        temp += (a & 0xF0) + (v & 0xF0)
-        temp2 = temp
-        if temp >= 0xA0:
-            temp += 0x60
-
-        self.ps.flags.overflow = bool((~(a ^ v) & (a ^ temp2)) & 0x80)
-        self.ps.flags.carry = bool(temp > 99)
-        self.ps.flags.negative = bool((temp & 0xFF) >> 7)
-        self.ps.flags.zero = ((a + v + self.ps.flags.carry) & 0xFF) == 0
-        self.registers.A = (temp & 0xFF)
-
-    def __subtract_from_accumulator_bin(self, value: int) -> None:
-        """Subtract the value from the accumulator in binary mode, then set all the appropriate flags/registers.
-
-        Args:
-            value (int): The value to subtract from the accumulator.
-        """
-        a = self.registers.A
-        c = self.ps.flags.carry
-        v = value
-        result = a + (v ^ 0xFF) + c
-        self.ps.flags.carry = result != (result & 0xFF)
-        result &= 0xFF
-        self.ps.flags.overflow = bool(
-            (a ^ result) & ((v ^ 0xFF) ^ result) & 0x80)
-        self.ps.flags.zero = not bool(result)
-        self.ps.flags.negative = bool(result & (1 << 7))
-        self.registers.A = result
-
-    def __subtract_from_accumulator_dec(self, value: int) -> None:
-        """Subtract the value from the accumulator in decimal mode, then set all the appropriate flags/registers.
-
-        Args:
-            value (int): The value to subtract from the accumulator.
-        """
-        # After days of frustration, this is slightly altered code from mnaberez's py65
-        # project...and I greatly appreciate that it works as does my sanity...
-        a = self.registers.A
-        v = value
-
-        halfcarry = 1
-        decimalcarry = 0
-        adjust0 = 0
-        adjust1 = 0
-
-        nibble0 = (a & 0xf) + (~v & 0xf) + self.ps.flags.carry
-        if nibble0 <= 0xf:
-            halfcarry = 0
-            adjust0 = 10
-        nibble1 = ((a >> 4) & 0xf) + ((~v >> 4) & 0xf) + halfcarry
-        if nibble1 <= 0xf:
-            adjust1 = 10 << 4
-
-        # the ALU outputs are not decimally adjusted
-        aluresult = a + (~v & 0xFF) + self.ps.flags.carry
-
-        if aluresult > 0xFF:
-            decimalcarry = 1
-        aluresult &= 0xFF
-
-        # but the final result will be adjusted
-        nibble0 = (aluresult + adjust0) & 0xf
-        nibble1 = ((aluresult + adjust1) >> 4) & 0xf
-
-        self.ps.flags.zero = aluresult == 0
-        self.ps.flags.carry = bool(decimalcarry)
-        self.ps.flags.overflow = bool(((a ^ v) & (a ^ aluresult)) & 0x80)
-        self.ps.flags.negative = bool(aluresult >> 7)
-        self.registers.A = (nibble1 << 4) + nibble0
+        registers = self.registers
+        ps = self.ps
+        p = ps.value
+        packed = table[registers.A | value << 8 | (p & 0x01) << 16]
+        registers.A = packed & 0xFF
+        ps.value = p & 0x3C | packed >> 8
 
 
 class StackMixin:
     """Stack methods associated with pulling and pushing values onto the stack.
     """
 
+    __slots__ = ()
+
     def _s_push_address(self, address: int):
         """Push an address onto the stack
 
@@ -276,10 +549,13 @@ class StackMixin:
         Args:
             value (int): an unsigned 8-bit value
         """
-        value &= 0xFF
+        bus = self.bus
         address = 0x100 + self.registers.stack_pointer
-        self.registers.stack_pointer -= 1
-        self.bus.write(address, value)
+        self.registers.stack_pointer = (self.registers.stack_pointer - 1) & 0xFF
+        if bus.direct_write[1]:
+            bus.memory[address] = value & 0xFF
+        else:
+            bus.write(address, value & 0xFF)
 
     def _s_pop_address(self) -> int:
         """Pop an address off the stack
@@ -295,7 +571,7 @@ class StackMixin:
         Returns:
             int: An 8-bit unsigned integer value
         """
-        self.registers.stack_pointer += 1
+        bus = self.bus
+        self.registers.stack_pointer = (self.registers.stack_pointer + 1) & 0xFF
         address = 0x100 + self.registers.stack_pointer
-        value = self.bus.read(address)
-        return value
+        return bus.memory[address] if bus.direct_read[1] else bus.read(address)
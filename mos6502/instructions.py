@@ -94,6 +94,33 @@ instr_6502_illegal = {
     "sre": [0x47, 0x57, 0x4F, 0x5F, 0x5B, 0x43, 0x53],
 }
 
+# Addressing modes (opcodes are resolved through the CPU's addressing table)
+addr_6502 = {
+    "immediate": [0x09, 0x29, 0x49, 0x69, 0xA0, 0xA2, 0xA9, 0xC0, 0xC9, 0xE0, 0xE9],
+    "zero_page": [0x05, 0x06, 0x24, 0x25, 0x26, 0x45, 0x46, 0x65, 0x66, 0x84, 0x85, 0x86, 0xA4, 0xA5, 0xA6, 0xC4, 0xC5, 0xC6, 0xE4, 0xE5, 0xE6],
+    "zero_page_x": [0x15, 0x16, 0x35, 0x36, 0x55, 0x56, 0x75, 0x76, 0x94, 0x95, 0xB4, 0xB5, 0xD5, 0xD6, 0xF5, 0xF6],
+    "zero_page_y": [0x96, 0xB6],
+    "absolute": [0x0D, 0x0E, 0x2C, 0x2D, 0x2E, 0x4C, 0x4D, 0x4E, 0x6D, 0x6E, 0x8C, 0x8D, 0x8E, 0xAC, 0xAD, 0xAE, 0xCC, 0xCD, 0xCE, 0xEC, 0xED, 0xEE],
+    "absolute_x": [0x1D, 0x1E, 0x3D, 0x3E, 0x5D, 0x5E, 0x7D, 0x7E, 0x9D, 0xBC, 0xBD, 0xDD, 0xDE, 0xFD, 0xFE],
+    "absolute_y": [0x19, 0x39, 0x59, 0x79, 0x99, 0xB9, 0xBE, 0xD9, 0xF9],
+    "indirect": [0x6C],
+    "x_indexed_zp_indirect": [0x01, 0x21, 0x41, 0x61, 0x81, 0xA1, 0xC1, 0xE1],
+    "zp_indirect_y_indexed": [0x11, 0x31, 0x51, 0x71, 0x91, 0xB1, 0xD1, 0xF1],
+}
+
+# Addressing modes for the illegal opcodes that read or write memory
+addr_6502_illegal = {
+    "immediate": [0x80, 0x82, 0x89, 0xC2, 0xE2],
+    "zero_page": [0x04, 0x07, 0x27, 0x44, 0x47, 0x64, 0x67, 0x87, 0xA7, 0xC7, 0xE7],
+    "zero_page_x": [0x14, 0x17, 0x34, 0x37, 0x54, 0x57, 0x74, 0x77, 0xD4, 0xD7, 0xF4, 0xF7],
+    "zero_page_y": [0x97, 0xB7],
+    "absolute": [0x0C, 0x0F, 0x2F, 0x4F, 0x6F, 0x8F, 0xAF, 0xCF, 0xEF],
+    "absolute_x": [0x1C, 0x1F, 0x3C, 0x3F, 0x5C, 0x5F, 0x7C, 0x7F, 0xDC, 0xDF, 0xFC, 0xFF],
+    "absolute_y": [0x1B, 0x3B, 0x5B, 0x7B, 0xBB, 0xBF, 0xDB, 0xFB],
+    "x_indexed_zp_indirect": [0x03, 0x23, 0x43, 0x63, 0x83, 0xA3, 0xC3, 0xE3],
+    "zp_indirect_y_indexed": [0x13, 0x33, 0x53, 0x73, 0xB3, 0xD3, 0xF3],
+}
+
 def generate_inst_map(include_illegal: bool = True) -> dict:
     """Generate a map of opcodes and its associated instruction. This is used by the CPU to determine which method to use.
 
@@ -104,13 +131,25 @@ def generate_inst_map(include_illegal: bool = True) -> dict:
         dict: A map of opcodes to their associated instruction.
     """
     new = dict()
-    i_6502 = instr_6502
-    if include_illegal:
-        keys = set(instr_6502).union(instr_6502_illegal)
-        i_6502 = dict((k, instr_6502.get(k, []) + instr_6502_illegal.get(k, [])) for k in keys)
-        
-    i_6502 = {i: list(set(j)) for i, j in i_6502.items()}
-    for inst, opcodes in i_6502.items():
-        for opcode in opcodes:
-            new[opcode] = inst
+    for instructions in (instr_6502, instr_6502_illegal) if include_illegal else (instr_6502,):
+        for inst, opcodes in instructions.items():
+            for opcode in opcodes:
+                new[opcode] = inst
+    return dict(sorted(new.items()))
+
+
+def generate_addr_map(include_illegal: bool = True) -> dict:
+    """Generate a map of opcodes and the addressing mode they use.  This is used by the CPU to build its addressing table.
+
+    Args:
+        include_illegal (bool): Include the addressing modes of the illegal opcodes in the map.
+
+    Returns:
+        dict: A map of opcodes to their associated addressing mode.
+    """
+    new = dict()
+    for modes in (addr_6502, addr_6502_illegal) if include_illegal else (addr_6502,):
+        for mode, opcodes in modes.items():
+            for opcode in opcodes:
+                new[opcode] = mode
     return dict(sorted(new.items()))
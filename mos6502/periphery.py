@@ -1,38 +1,12 @@
-import ctypes
-
-
-class Register8:
-    """A set of descriptors to store unsigned 8-bit values that roll-over and roll-under.
-    """
-
-    def __set_name__(self, owner, name):
-        self.private_name = '_' + name
-
-    def __get__(self, obj, objtype=None) -> int:
-        register = getattr(obj, self.private_name)
-        return register.value
-
-    def __set__(self, obj, value: int):
-        setattr(obj, self.private_name, ctypes.c_uint8(value))
-
-
-class Register16(Register8):
-    """A set of descriptors to store unsigned 16-bit values that roll-over and roll-under.
-    """
-
-    def __set__(self, obj, value: int):
-        setattr(obj, self.private_name, ctypes.c_uint16(value))
+# Negative and zero status bits for every possible byte result
+NZ_FLAGS = bytes((value & 0x80) | (0x00 if value else 0x02) for value in range(0x100))
 
 
 class Registers:
-    """An implementation of the 6502 CPU's registers.
+    """An implementation of the 6502 CPU's registers.  The registers are plain integers, so anything that writes to them has to keep the 8-bit registers within `0x00`-`0xFF` and the program counter within `0x0000`-`0xFFFF`.
     """
 
-    A = Register8()
-    X = Register8()
-    Y = Register8()
-    program_counter = Register16()
-    stack_pointer = Register8()
+    __slots__ = ('A', 'X', 'Y', 'program_counter', 'stack_pointer')
 
     def __init__(self):
         self.A = 0x00
@@ -42,38 +16,58 @@ class Registers:
         self.stack_pointer = 0xFF
 
 
-class StatusInt(ctypes.Structure):
-    """For the processor status information, this is the unsigned 8-bit value that all of the flags will 'sum' up to.  Used to push/pop the processor status to/from the stack
+class StatusFlag:
+    """A descriptor that exposes a single bit of the packed processor status as a flag.
     """
 
-    _fields_ = [("value", ctypes.c_uint8)]
+    def __init__(self, mask: int):
+        self.mask = mask
 
+    def __get__(self, obj, objtype=None) -> int:
+        return 1 if obj.value & self.mask else 0
 
-class StatusFlags(ctypes.Structure):
-    """For the processor status information, this is each bit of an unsigned 8-bit value represented as individual bits using a C bitfield.  Makes it easy to set individual flags.
-    """
-
-    _fields_ = [
-        ("carry", ctypes.c_uint8, 1),
-        ("zero", ctypes.c_uint8, 1),
-        ("interrupt_mask", ctypes.c_uint8, 1),
-        ("decimal", ctypes.c_uint8, 1),
-        ("pbreak", ctypes.c_uint8, 1),
-        ("_unused", ctypes.c_uint8, 1),
-        ("overflow", ctypes.c_uint8, 1),
-        ("negative", ctypes.c_uint8, 1),
-    ]
+    def __set__(self, obj, value: int):
+        if value & 1:
+            obj.value |= self.mask
+        else:
+            obj.value &= ~self.mask & 0xFF
 
 
-class Status(ctypes.Union):
-    """A C-typed union of bit flags and an unsigned integer to represent the flags used by the 6502 CPU.
+class Status:
+    """The processor status of the 6502 CPU packed into a single unsigned 8-bit value.  The hot paths in the CPU update `value` directly with the flag masks below, while the flag descriptors make it easy to read or set individual flags.
     """
 
-    _fields_ = [
-        ("status", StatusInt),
-        ("flags", StatusFlags),
-    ]
+    __slots__ = ('value',)
+
+    CARRY = 0x01
+    ZERO = 0x02
+    INTERRUPT_MASK = 0x04
+    DECIMAL = 0x08
+    BREAK = 0x10
+    UNUSED = 0x20
+    OVERFLOW = 0x40
+    NEGATIVE = 0x80
+
+    carry = StatusFlag(CARRY)
+    zero = StatusFlag(ZERO)
+    interrupt_mask = StatusFlag(INTERRUPT_MASK)
+    decimal = StatusFlag(DECIMAL)
+    pbreak = StatusFlag(BREAK)
+    _unused = StatusFlag(UNUSED)
+    overflow = StatusFlag(OVERFLOW)
+    negative = StatusFlag(NEGATIVE)
 
     def __init__(self):
-        self.flags._unused = True
-        self.flags.pbreak = False
+        self.value = Status.UNUSED
+
+    @property
+    def status(self) -> "Status":
+        """The status as an unsigned 8-bit value, kept so `ps.status.value` works as it did with the ctypes union.
+        """
+        return self
+
+    @property
+    def flags(self) -> "Status":
+        """The status as individual flags, kept so `ps.flags.carry` and friends work as they did with the ctypes union.
+        """
+        return self
@@ -50,12 +50,12 @@ branchOnOverflowClear:
     INX
     LDA #$01
     ADC #$10
-    BVC branchOnCarrySet
+    BVC branchOnOverflowSet
     JMP failed
 
 branchOnOverflowSet:
     INX
-    LDA #$FF
+    LDA #$7F
     ADC #$01
     BVS completed
     JMP failed
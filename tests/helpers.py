@@ -16,10 +16,7 @@ def get_memory_chunk_by_address(start_range: int, end_range: int, cpu: CPU) -> L
     Returns:
         List[int]: The bytes retreived from the bus converted to ints.
     """
-    data = list()
-    for i in range(start_range, end_range):
-        data.append(cpu.bus.read(i))
-    return data
+    return list(cpu.bus.read_range(start_range, end_range))
 
 def get_memory_chunk_by_size(start_range: int, size: int, cpu: CPU) -> List[int]:
     """Retrieve a contiguous chunk of memory from the Bus given an address and a length in bytes.
@@ -32,10 +29,7 @@ def get_memory_chunk_by_size(start_range: int, size: int, cpu: CPU) -> List[int]
     Returns:
         List[int]: The bytes retreived from the bus converted to ints.
     """
-    data = list()
-    for i in range(start_range, start_range + size):
-        data.append(cpu.bus.read(i))
-    return data
+    return list(cpu.bus.read_range(start_range, start_range + size))
 
 def compare_results_to_memory(address: int, data: Union[List[int], str], cpu: CPU, labels: Union[List[str], None] = None) -> None:
     """Given a list of values and a set of optional labels, compare them to values in emulator memory.
@@ -47,18 +41,21 @@ def compare_results_to_memory(address: int, data: Union[List[int], str], cpu: CP
         labels (Union[List[str], None], optional): A list of labels associated with each value compared. Defaults to None.
     """
 
-    if type(data) == str:
-        data = [int(i, 16) for i in data.split()]
+    if isinstance(data, str):
+        data = list(bytes.fromhex(data))
 
     data_emul = get_memory_chunk_by_size(
         address, len(data), cpu)
+    if data == data_emul:
+        return
 
+    # Report every value in a single write so the mismatches can be seen side by side
+    lines = list()
     for i in range(0, len(data)):
-        if labels:
-            print(f"+ [TEST:0x{address + i:04X}] <{labels[i]}> 0x{data[i]:02X} (Real) <=> 0x{data_emul[i]:02X} (Emul)")
-        else:
-            print(f"+ [TEST:0x{address + i:04X}] 0x{data[i]:02X} (Real) <=> 0x{data_emul[i]:02X} (Emul)")
-        assert data[i] == data_emul[i]
+        label = f" <{labels[i]}>" if labels else ""
+        lines.append(f"+ [TEST:0x{address + i:04X}]{label} 0x{data[i]:02X} (Real) <=> 0x{data_emul[i]:02X} (Emul)")
+    print("\n".join(lines))
+    assert data == data_emul
 
 
 def setup_cpu(program_file: Union[Path, str]) -> CPU:
@@ -1,3 +1,4 @@
+from mos6502.cpu_mixins import KERNEL_TABLES, add_bin, add_dec, subtract_dec
 from tests.helpers import compare_results_to_memory, setup_cpu
 
 cpu = setup_cpu("tests/asm/inst_adc.out")
@@ -62,3 +63,18 @@ def test_sbc_values_decimal():
         data=values_raw,
         cpu=cpu
     )
+
+
+def test_kernel_tables():
+    """Verify a few kernel table entries, with the result in the low byte and the C, Z, V and N flags packed above it.
+    """
+    # 0x50 + 0x50 overflows into the sign bit: V and N set
+    assert KERNEL_TABLES[add_bin][0x50 | 0x50 << 8] == 0xA0 | 0xC0 << 8
+    # 0xFF + 0x01 wraps to zero: C and Z set
+    assert KERNEL_TABLES[add_bin][0xFF | 0x01 << 8] == 0x00 | 0x03 << 8
+    # 09 + 01 carries into the tens digit in decimal mode
+    assert KERNEL_TABLES[add_dec][0x09 | 0x01 << 8] & 0xFF == 0x10
+    # 00 - 01 borrows in decimal mode: 99 with C clear
+    packed = KERNEL_TABLES[subtract_dec][0x00 | 0x01 << 8 | 1 << 16]
+    assert packed & 0xFF == 0x99
+    assert not packed >> 8 & 0x01
@@ -1,3 +1,4 @@
+from mos6502.cpu import convert_int
 from tests.helpers import setup_cpu
 
 cpu = setup_cpu(program_file="tests/asm/inst_branch.out")
@@ -12,5 +13,15 @@ def test_compare_results_output():
     print("SP:", hex(cpu.registers.stack_pointer))
     value = cpu.bus.read(0x01FF)
     if value:
-        print(f"Error in the {result_codes[value + 1]} instruction/opcode!")
+        print(f"Error in the {result_codes[value - 1]} instruction/opcode!")
     assert cpu.bus.read(0x01FF) == 0x00
+
+
+def test_convert_int_signed_offsets():
+    """Verify that branch offsets with bit 7 set are converted to negative values.
+    """
+    assert convert_int(0x00) == 0
+    assert convert_int(0x7F) == 127
+    assert convert_int(0x80) == -128
+    assert convert_int(0xFE) == -2
+    assert convert_int(0xFF) == -1
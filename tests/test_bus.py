@@ -0,0 +1,107 @@
+from pathlib import Path
+
+from mos6502.bus import Bus, BusRam, BusRom
+
+
+def test_attach_maps_ram_and_rom():
+    """Verify that plain RAM and ROM are mapped into the bus memory and that writes reach the bus object's data.
+    """
+    bus = Bus()
+    ram = BusRam()
+    rom = BusRom()
+    rom.data[0x0001] = 0x42
+    bus.attach(ram, starting_page=0x00, ending_page=0x0F)
+    bus.attach(rom, starting_page=0x10, ending_page=0x1F)
+
+    assert bus.direct_read[0x00] and bus.direct_write[0x00]
+    assert bus.direct_read[0x10] and not bus.direct_write[0x10]
+    assert bus.read(0x1001) == 0x42
+
+    bus.write(0x0123, 0x1FF)
+    assert bus.read(0x0123) == 0xFF
+    assert ram.data[0x0123] == 0xFF
+
+    bus.write(0x1001, 0x00)
+    assert bus.read(0x1001) == 0x42
+
+
+def test_load_program_after_attach(tmp_path: Path):
+    """Verify that a program loaded into an attached ROM is visible on the bus, even when it runs past the attached pages.
+    """
+    program = tmp_path / "program.out"
+    program.write_bytes(bytes(range(1, 0x21)))
+
+    bus = Bus()
+    rom = BusRom()
+    bus.attach(rom, starting_page=0x10, ending_page=0x10)
+    rom.load_program(program, address=0xF0)
+
+    assert bus.read(0x10F0) == 0x01
+    assert bus.read(0x10FF) == 0x10
+    assert rom.data[0x0100] == 0x11
+
+
+def test_data_reassignment_remaps():
+    """Verify that assigning new data to a mapped bus object replaces what the bus sees.
+    """
+    bus = Bus()
+    ram = BusRam()
+    bus.attach(ram, starting_page=0x00, ending_page=0x00)
+    bus.write(0x0005, 0x07)
+
+    ram.data = dict()
+    assert bus.read(0x0005) == 0x00
+
+    ram.data[0x0005] = 0x09
+    assert bus.read(0x0005) == 0x09
+
+
+def test_reset_bus_unmaps():
+    """Verify that resetting the bus hands the data back to the bus objects and unmaps their pages.
+    """
+    bus = Bus()
+    ram = BusRam()
+    bus.attach(ram, starting_page=0x00, ending_page=0x00)
+    bus.write(0x0010, 0x33)
+    bus.reset_bus()
+
+    assert type(ram.data) is dict
+    assert ram.data[0x0010] == 0x33
+    assert not bus.direct_read[0x00]
+    assert bus.read(0x0010) == bus.default_read_value
+
+
+def test_mirror_and_reattach_fall_back_to_bus_objects():
+    """Verify that attaching an object more than once, or over part of another one, keeps the data and goes back through the bus objects.
+    """
+    bus = Bus()
+    ram = BusRam()
+    other = BusRam()
+    bus.attach(ram, starting_page=0x00, ending_page=0x01)
+    bus.write(0x0010, 0x44)
+    bus.write(0x0110, 0x55)
+
+    bus.attach(ram, starting_page=0x20, ending_page=0x20, mirror=True)
+    assert not bus.direct_read[0x00]
+    assert bus.read(0x0010) == 0x44
+    bus.write(0x0011, 0x66)
+    assert ram.data[0x0011] == 0x66
+
+    bus.attach(other, starting_page=0x00, ending_page=0x00)
+    assert bus.direct_read[0x00]
+    assert bus.read(0x0010) == 0x00
+    assert bus.read(0x0110) == 0x55
+
+
+def test_read_range_matches_read():
+    """Verify that reading a range gives the same values as reading each address, whether or not the pages are mapped.
+    """
+    bus = Bus()
+    ram = BusRam()
+    bus.attach(ram, starting_page=0x00, ending_page=0x01)
+    for address in range(0x0000, 0x0200):
+        bus.write(address, address * 7)
+
+    assert bus.read_range(0x00F0, 0x0110) == bytes(bus.read(i) for i in range(0x00F0, 0x0110))
+    assert bus.read_range(0x01F0, 0x0210) == bytes(bus.read(i) for i in range(0x01F0, 0x0210))
+    assert bus.read_range(0x0210, 0x0210) == bytes()
@@ -0,0 +1,305 @@
+from mos6502.bus import Bus, BusRam
+from mos6502.cpu import CPU
+from tests.helpers import get_memory_chunk_by_size, setup_cpu
+
+
+def program_cpu(program: str, origin: int = 0x0200, use_illegal: bool = False) -> CPU:
+    """Setup a CPU with RAM across the whole bus and a short program written into it.
+
+    Args:
+        program (str): The program as a space-delimited string of hex values.
+        origin (int, optional): The address to write the program to and start executing from. Defaults to 0x0200.
+        use_illegal (bool, optional): Allow the 'illegal' opcodes. Defaults to False.
+
+    Returns:
+        CPU: The newly instantiated CPU object to execute code on.
+    """
+    bus = Bus()
+    bus.attach(BusRam(), starting_page=0x00, ending_page=0xFF)
+    for address, value in enumerate(bytes.fromhex(program), start=origin):
+        bus.write(address, value)
+
+    cpu = CPU(origin=origin, use_illegal=use_illegal)
+    cpu.bus = bus
+    return cpu
+
+
+def cpu_state(cpu: CPU) -> tuple:
+    """Collect the registers, processor status and memory of a CPU so two CPUs can be compared.
+
+    Args:
+        cpu (CPU): The CPU to collect the state of.
+
+    Returns:
+        tuple: The registers, processor status and memory contents.
+    """
+    registers = cpu.registers
+    return (
+        registers.A,
+        registers.X,
+        registers.Y,
+        registers.stack_pointer,
+        registers.program_counter,
+        cpu.ps.value,
+        get_memory_chunk_by_size(0x0000, 0x10000, cpu),
+    )
+
+
+def test_step_many_matches_process_instruction():
+    """Verify that `step_many(n)` leaves the CPU in the same state as `n` calls to `process_instruction`.
+    """
+    for program in ("tests/asm/inst_adc.out", "tests/asm/addressing.out", "tests/asm/inst_branch.out"):
+        stepped = setup_cpu(program)
+        single = setup_cpu(program)
+        for count in (1, 7, 50):
+            stepped.step_many(count)
+            for _ in range(count):
+                single.process_instruction()
+            assert cpu_state(stepped) == cpu_state(single)
+
+
+def test_sed_switches_sbc_to_decimal():
+    """Verify that SBC uses decimal mode right after SED.
+    """
+    # SED, SEC, LDA #$10, SBC #$01
+    cpu = program_cpu("F8 38 A9 10 E9 01")
+    cpu.step_many(4)
+    assert cpu.registers.A == 0x09
+
+
+def test_plp_restores_decimal_flag():
+    """Verify that pulling the processor status with PLP switches ADC between binary and decimal mode.
+    """
+    # LDA #$08, PHA, PLP, CLC, LDA #$09, ADC #$01
+    cpu = program_cpu("A9 08 48 28 18 A9 09 69 01")
+    cpu.step_many(6)
+    assert cpu.registers.A == 0x10
+
+    # SED, LDA #$00, PHA, PLP, CLC, LDA #$09, ADC #$01
+    cpu = program_cpu("F8 A9 00 48 28 18 A9 09 69 01")
+    cpu.step_many(7)
+    assert cpu.registers.A == 0x0A
+
+
+def test_rti_restores_decimal_flag():
+    """Verify that returning from an interrupt with RTI switches ADC to decimal mode when the pulled status has D set.
+    """
+    # LDA #$02, PHA, LDA #$10, PHA, LDA #$08, PHA, RTI
+    cpu = program_cpu("A9 02 48 A9 10 48 A9 08 48 40")
+    # CLC, LDA #$09, ADC #$01
+    for address, value in enumerate((0x18, 0xA9, 0x09, 0x69, 0x01), start=0x0210):
+        cpu.bus.write(address, value)
+    cpu.step_many(10)
+    assert cpu.registers.program_counter == 0x0215
+    assert cpu.registers.A == 0x10
+
+
+def test_decimal_flag_set_from_outside():
+    """Verify that setting or clearing the decimal flag directly is picked up by the next `step_many` or `process_instruction`.
+    """
+    # CLC, LDA #$09, ADC #$01, CLC, LDA #$09, ADC #$01
+    cpu = program_cpu("18 A9 09 69 01 18 A9 09 69 01")
+    cpu.step_many(2)
+    cpu.ps.flags.decimal = 1
+    cpu.step_many(1)
+    assert cpu.registers.A == 0x10
+
+    cpu.step_many(2)
+    cpu.ps.flags.decimal = 0
+    cpu.process_instruction()
+    assert cpu.registers.A == 0x0A
+
+
+def test_trace_records_current_instruction():
+    """Verify that the current instruction is only recorded while tracing is enabled.
+    """
+    # LDA #$09, STA $1234, CLC
+    cpu = program_cpu("A9 09 8D 34 12 18")
+    cpu.process_instruction()
+    assert cpu.current_instruction == []
+
+    cpu.enable_trace()
+    cpu.process_instruction()
+    assert cpu.current_instruction_pc == 0x0202
+    assert cpu.current_instruction == [0x8D, 0x34, 0x12]
+    cpu.step_many(1)
+    assert cpu.current_instruction_pc == 0x0205
+    assert cpu.current_instruction == [0x18]
+
+    cpu.disable_trace()
+    cpu.registers.program_counter = 0x0200
+    cpu.process_instruction()
+    assert cpu.current_instruction == [0x18]
+
+
+def test_pulled_status_ignores_bits_4_and_5():
+    """Verify that PLP and RTI keep the break bit clear and the unused bit set whatever was on the stack.
+    """
+    # LDA #$FF, PHA, PLP
+    cpu = program_cpu("A9 FF 48 28")
+    cpu.step_many(3)
+    assert cpu.ps.value == 0xEF
+
+    # LDA #$02, PHA, LDA #$10, PHA, LDA #$10, PHA, RTI
+    cpu = program_cpu("A9 02 48 A9 10 48 A9 10 48 40")
+    cpu.step_many(7)
+    assert cpu.ps.value == 0x20
+
+
+def test_and_and_lsr_flags_follow_the_result():
+    """Verify that AND and LSR A set the negative and zero flags from the result rather than the operand.
+    """
+    # LDA #$F0, AND #$0F
+    cpu = program_cpu("A9 F0 29 0F")
+    cpu.step_many(2)
+    assert cpu.registers.A == 0x00
+    assert cpu.ps.zero and not cpu.ps.negative
+
+    # LDA #$81, LSR A
+    cpu = program_cpu("A9 81 4A")
+    cpu.step_many(2)
+    assert cpu.registers.A == 0x40
+    assert cpu.ps.carry and not cpu.ps.negative and not cpu.ps.zero
+
+
+def test_absolute_operand_across_a_page_boundary():
+    """Verify that absolute operands split across two pages are read byte by byte.
+    """
+    # LDA $1234 with its operand crossing into the next page, JMP $0400
+    cpu = program_cpu("AD 34 12 4C 00 04", origin=0x02FE)
+    cpu.bus.write(0x1234, 0x56)
+    cpu.step_many(2)
+    assert cpu.registers.A == 0x56
+    assert cpu.registers.program_counter == 0x0400
+
+
+def test_run_block_stops_on_the_halt_opcode():
+    """Verify that run_block stops before the halt opcode and reports how many instructions ran.
+    """
+    # INX, INX, INX, BRK
+    cpu = program_cpu("E8 E8 E8 00")
+    assert cpu.run_block(10, halt_on=0x00) == 3
+    assert cpu.registers.X == 0x03
+    assert cpu.registers.program_counter == 0x0203
+
+    cpu = program_cpu("E8 E8 E8 00")
+    assert cpu.run_block(2) == 2
+    assert cpu.registers.X == 0x02
+
+
+def test_registers_wrap_around():
+    """Verify that the accumulator, stack pointer and program counter wrap around now that the registers are plain integers.
+    """
+    # LDA #$FF, ASL A, ADC #$FF
+    cpu = program_cpu("A9 FF 0A 69 FF")
+    cpu.step_many(3)
+    assert cpu.registers.A == 0xFE
+
+    # LDX #$00, TXS, PHA, PHA
+    cpu = program_cpu("A2 00 9A 48 48")
+    cpu.step_many(4)
+    assert cpu.registers.stack_pointer == 0xFE
+
+    # NOP at the top of memory
+    cpu = program_cpu("EA", origin=0xFFFF)
+    cpu.step_many(1)
+    assert cpu.registers.program_counter == 0x0000
+
+
+def test_brk_pushes_break_bit_without_setting_it():
+    """Verify that BRK pushes the status with bits 4 and 5 set while leaving the break bit clear in the live status.
+    """
+    cpu = program_cpu("00")
+    cpu.step_many(1)
+    assert cpu.bus.read(0x01FD) == 0x30
+    assert cpu.ps.value == 0x24
+
+
+def test_sbx_subtracts_from_a_and_x():
+    """Verify that SBX stores (A AND X) minus the immediate value into X and sets the flags like a compare.
+    """
+    # LDA #$F3, LDX #$3E, SBX #$02
+    cpu = program_cpu("A9 F3 A2 3E CB 02", use_illegal=True)
+    cpu.step_many(3)
+    assert cpu.registers.X == 0x30
+    assert cpu.registers.A == 0xF3
+    assert cpu.ps.carry and not cpu.ps.zero and not cpu.ps.negative
+
+
+def test_slo_flags_follow_the_stored_byte():
+    """Verify that SLO sets zero and negative from the accumulator byte rather than the unmasked shift.
+    """
+    # LDA #$00, SLO $10
+    cpu = program_cpu("A9 00 07 10", use_illegal=True)
+    cpu.bus.write(0x0010, 0x80)
+    cpu.step_many(2)
+    assert cpu.bus.read(0x0010) == 0x00
+    assert cpu.registers.A == 0x00
+    assert cpu.ps.carry and cpu.ps.zero and not cpu.ps.negative
+
+
+def test_rra_rotates_memory_then_adds():
+    """Verify that RRA rotates memory right through the carry, stores it back, then adds it to the accumulator with the carry it rotated out.
+    """
+    # CLC, LDA #$10, RRA $10
+    cpu = program_cpu("18 A9 10 67 10", use_illegal=True)
+    cpu.bus.write(0x0010, 0x03)
+    cpu.step_many(3)
+    assert cpu.bus.read(0x0010) == 0x01
+    assert cpu.registers.A == 0x12
+    assert not cpu.ps.carry
+
+
+def test_rla_and_sre_store_the_shifted_byte():
+    """Verify that RLA and SRE write the rotated or shifted byte back to memory before combining it with the accumulator.
+    """
+    # SEC, LDA #$FF, RLA $10
+    cpu = program_cpu("38 A9 FF 27 10", use_illegal=True)
+    cpu.bus.write(0x0010, 0x81)
+    cpu.step_many(3)
+    assert cpu.bus.read(0x0010) == 0x03
+    assert cpu.registers.A == 0x03
+    assert cpu.ps.carry
+
+    # LDA #$01, SRE $10
+    cpu = program_cpu("A9 01 47 10", use_illegal=True)
+    cpu.bus.write(0x0010, 0x03)
+    cpu.step_many(2)
+    assert cpu.bus.read(0x0010) == 0x01
+    assert cpu.registers.A == 0x00
+    assert cpu.ps.carry and cpu.ps.zero
+
+
+def test_immediate_illegal_opcodes():
+    """Verify the results and flags of ANC, ASR and ARR, which combine an AND with the immediate value with a shift or rotate.
+    """
+    # LDA #$F0, ANC #$81
+    cpu = program_cpu("A9 F0 0B 81", use_illegal=True)
+    cpu.step_many(2)
+    assert cpu.registers.A == 0x80
+    assert cpu.ps.carry and cpu.ps.negative and not cpu.ps.zero
+
+    # LDA #$03, ASR #$FF
+    cpu = program_cpu("A9 03 4B FF", use_illegal=True)
+    cpu.step_many(2)
+    assert cpu.registers.A == 0x01
+    assert cpu.ps.carry and not cpu.ps.negative and not cpu.ps.zero
+
+    # SEC, LDA #$FF, ARR #$C0
+    cpu = program_cpu("38 A9 FF 6B C0", use_illegal=True)
+    cpu.step_many(3)
+    assert cpu.registers.A == 0xE0
+    assert cpu.ps.carry and cpu.ps.negative and not cpu.ps.overflow
+
+
+def test_las_reads_absolute_y():
+    """Verify that LAS ANDs the byte at an absolute Y-indexed address with the stack pointer and loads the result into A, X and the stack pointer.
+    """
+    # LDY #$01, LAS $0300,Y
+    cpu = program_cpu("A0 01 BB 00 03", use_illegal=True)
+    cpu.bus.write(0x0301, 0x0F)
+    stack_pointer = cpu.registers.stack_pointer
+    cpu.step_many(2)
+    result = stack_pointer & 0x0F
+    assert cpu.registers.A == cpu.registers.X == cpu.registers.stack_pointer == result
+    assert cpu.registers.program_counter == 0x0205
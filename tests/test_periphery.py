@@ -0,0 +1,40 @@
+from mos6502.periphery import Status
+
+
+def test_status_starts_with_unused_bit():
+    """Verify that a new processor status only has the unused bit set.
+    """
+    ps = Status()
+    assert ps.value == 0x20
+    assert ps.status.value == 0x20
+    assert ps.flags._unused == 1
+    assert ps.flags.pbreak == 0
+
+
+def test_status_flags_and_value():
+    """Verify that the individual flags and the packed status value stay in step.
+    """
+    ps = Status()
+    ps.flags.carry = 1
+    ps.flags.negative = 1
+    assert ps.status.value == 0xA1
+    assert ps.flags.carry == 1
+
+    ps.status.value = 0x4A
+    assert (ps.flags.overflow, ps.flags.decimal, ps.flags.zero, ps.flags.carry) == (1, 1, 1, 0)
+
+    ps.flags.zero = 0
+    assert ps.value == 0x48
+
+
+def test_status_flags_truncate_to_one_bit():
+    """Verify that writing to a flag keeps only the lowest bit of the value, like a 1-bit C bitfield.
+    """
+    ps = Status()
+    ps.flags.carry = True
+    assert ps.flags.carry == 1
+    ps.flags.carry = 2
+    assert ps.flags.carry == 0
+    ps.flags.overflow = 3
+    assert ps.flags.overflow == 1
+    assert ps.value == 0x60